@@ -94,7 +94,8 @@ class DatabaseManager:
     """SQLite database manager with integrated rate limiting.
 
     Handles storage, retrieval, and deletion of document chunks while enforcing
-    minimum query intervals via RateLimiter.
+    minimum query intervals via RateLimiter. Blocking SQLite work runs in a worker
+    thread so database access does not stall the event loop.
 
     Attributes:
         db_path (str): Path to SQLite database file
@@ -167,7 +168,10 @@ class DatabaseManager:
             DatabaseNotAccessibleError: If database operation fails
         """
         await self.rate_limiter.acquire()
+        return await asyncio.to_thread(self._store_chunk, chunk)
 
+    def _store_chunk(self, chunk: DocumentChunk) -> bool:
+        """Blocking body of store_chunk, run in a worker thread."""
         try:
             # Generate chunk hash if not provided
             if not chunk.chunk_hash:
@@ -214,7 +218,10 @@ class DatabaseManager:
             DatabaseNotAccessibleError: If retrieval fails
         """
         await self.rate_limiter.acquire()
+        return await asyncio.to_thread(self._get_all_chunks)
 
+    def _get_all_chunks(self) -> List[DocumentChunk]:
+        """Blocking body of get_all_chunks, run in a worker thread."""
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
@@ -269,7 +276,10 @@ class DatabaseManager:
             DatabaseNotAccessibleError: If deletion fails
         """
         await self.rate_limiter.acquire()
+        return await asyncio.to_thread(self._delete_chunk, chunk_hash)
 
+    def _delete_chunk(self, chunk_hash: str) -> bool:
+        """Blocking body of delete_chunk, run in a worker thread."""
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
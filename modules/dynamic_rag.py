@@ -12,7 +12,6 @@ This module implements a comprehensive framework for building a RAG system with:
 The system supports document chunking, embedding generation, storage, and retrieval
 with configurable parameters for chunk size, overlap, and similarity thresholds.
 """
-import asyncio
 import os
 import pathlib
 import re
@@ -158,8 +157,9 @@ class DynamicRAGSystem:
                              overlap: Optional[int] = None) -> List[str]:
         """Store a document by splitting into chunks and generating embeddings.
 
-        Automatically generates chunk_hash from content. Enforces 0.5s delay between
-        consecutive chunk storage operations to comply with database rate limiting.
+        Automatically generates chunk_hash from content. No delay is added between chunks:
+        successive writes are spaced by the DatabaseManager's RateLimiter, which enforces
+        at least RateLimiter.min_interval (0.1 s by default) between database operations.
 
         Args:
             content (str): Full document text
@@ -208,10 +208,6 @@ class DynamicRAGSystem:
                 await self.db_manager.store_chunk(chunk)
                 chunk_hashes.append(chunk.chunk_hash)
 
-                # Add delay between chunks to comply with rate limiting
-                if i < len(chunks) - 1:
-                    await asyncio.sleep(0.5)
-
         logging.info(f"{self.db_path.name}: Document stored with {len(chunk_hashes)} chunks")
         return chunk_hashes
 
@@ -436,7 +432,7 @@ class DynamicRAGSystem:
     async def update_chunk(self, chunk_hash: str, new_content: str, actors: List[str]) -> bool:
         """Update chunk content through delete-then-store operation.
 
-        Includes 0.5s rate limiting delay between operations to comply with database constraints.
+        Database operations are throttled by the DatabaseManager rate limiter.
 
         Args:
             chunk_hash (str): SHA-256 hash of chunk to update
@@ -51,9 +51,9 @@ class Injector:
         - Injector objects can be nested. For example: with Injector(postmaster, "user") as user: with user = Injector(postmaster, "admin"): ...
 
     Side Effects:
-        - Injectors can be used to prime the system with persistent replies that will be stored in the internal _incoming_replies dictionary of a receiving 'Region' instance.
+        - Injectors can be used to prime the system with persistent replies that will be stored in the internal _incoming_replies queue of a receiving 'Region' instance.
         - Instances of the 'Region' class only retain one content string per source at any given time, with any new reply replacing the previous one.
-        - Injecting an empty reply using the same source identifier effectively deletes an original reply retained by a 'Region' instance, though an empty string keyed to the source will remain in its _incoming_replies dictionary.
+        - Injecting an empty reply using the same source identifier effectively deletes an original reply retained by a 'Region' instance, though an empty string keyed to the source will remain in its _incoming_replies queue.
     """
     postmaster: Postmaster
     source: str
@@ -251,6 +251,51 @@ class LLMLink:
                 response.raise_for_status()
                 return (await response.json())['choices'][0]['text']
 
+    async def text_batch(self, prompts: list[str], max_tokens: int = 4096) -> list[str]:
+        """Generate text completions for several prompts in a single request.
+
+        Sends all prompts to the text completion endpoint as a list-valued ``prompt``
+        (OpenAI-compatible servers such as llama.cpp accept this), so the server can
+        batch them and reuse work on any shared prefix.
+
+        Args:
+            prompts (list[str]): Prompt strings to send to the LLM
+            max_tokens (int, optional): Maximum number of tokens to generate per prompt. Defaults to 4096.
+
+        Returns:
+            list[str]: Generated text for each prompt, in the same order as ``prompts``
+
+        Raises:
+            aiohttp.ClientResponseError: On network/API errors
+            KeyError: If response structure doesn't match expected format
+            ValueError: If the number of completions doesn't match the number of prompts
+
+        Example:
+            >>> llm = LLMLink()
+            >>> await llm.text_batch(["Once upon a time", "Roses are red"], max_tokens=100)
+            ['in a galaxy far, far away...', 'violets are blue...']
+        """
+        data = {"prompt": prompts, "max_tokens": max_tokens, **self.params}
+
+        async with aiohttp.ClientSession(timeout=self.timeout) as session:
+            async with session.post(
+                    self._text_url,
+                    headers=self.headers,
+                    json=data,
+                    ssl=self.ssl
+            ) as response:
+                response.raise_for_status()
+                result = await response.json()
+
+        # Some servers answer a list prompt with one completion object per prompt
+        if isinstance(result, list):
+            texts = [item['choices'][0]['text'] for item in result]
+        else:
+            texts = [choice['text'] for choice in sorted(result['choices'], key=lambda c: c.get('index', 0))]
+        if len(texts) != len(prompts):
+            raise ValueError(f"Expected {len(prompts)} completions, got {len(texts)}")
+        return texts
+
     async def health(self) -> tuple[int, str]:
         """Check the health status of the LLM server.
 
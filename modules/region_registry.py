@@ -2,18 +2,75 @@
 Module RegionEntry and RegionRegistry classes for configuring and managing region instances
 """
 import json
+import os
 import pathlib
-from functools import partial
+from functools import lru_cache
 import inspect
 from dataclasses import dataclass
-from typing import List
+from typing import List, get_args
 
 from dynamic_rag import DynamicRAGSystem
 from llmlink import LLMLink
 from region_types import *
 
+try:
+    # Optional faster parser; both accept raw bytes and raise JSONDecodeError subclasses
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
-@dataclass
+try:
+    # Optional streaming parser, used for manifests larger than _STREAM_THRESHOLD bytes
+    import ijson
+except ImportError:
+    ijson = None
+
+_STREAM_THRESHOLD = 1 << 20
+
+# Optional RegionEntry fields copied from a live region when the region has them
+_OPTIONAL_ATTRS = ("connections", "rag", "llm", "reply_with_actors", "delay", "threshold", "max_inflight")
+# Optional RegionEntry fields passed to a region constructor when set and accepted
+_CONSTRUCTOR_ATTRS = ("rag", "llm", "reply_with_actors", "threshold", "delay", "max_inflight")
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def _type_needs(type_str: str) -> tuple[bool, bool, type[BaseRegion], frozenset[str]]:
+    """Resolve a region type string and report which default dependencies and arguments its constructor takes.
+
+    Results are cached per type string, so each region class is resolved and inspected once.
+    Dependencies are detected from parameter annotations (and their base classes) by class name, so
+    they match whether a region module imported them as e.g. llmlink.LLMLink or modules.llmlink.LLMLink.
+
+    Args:
+        type_str (str): Region type name as used in RegionEntry.type
+
+    Returns:
+        tuple[bool, bool, type[BaseRegion], frozenset[str]]: (needs_rag, needs_llm, region class,
+            accepted keyword arguments). A constructor taking **kwargs accepts every RegionEntry field.
+
+    Raises:
+        TypeError: If the type is not a subclass of BaseRegion
+        NameError: If the type is not a defined region type
+    """
+    cls = class_from_str(type_str)
+    parameters = inspect.signature(cls).parameters
+    annotations = set()
+    for p in parameters.values():
+        for annotation in (p.annotation, *get_args(p.annotation)):
+            if isinstance(annotation, type):
+                # Include base class names so subclasses of a dependency count as that dependency
+                annotations.update(base.__name__ for base in annotation.__mro__)
+            elif isinstance(annotation, str):
+                annotations.add(annotation)
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()):
+        accepted = frozenset(("task", "connections") + _CONSTRUCTOR_ATTRS)
+    else:
+        accepted = frozenset(parameters)
+    return DynamicRAGSystem.__name__ in annotations, LLMLink.__name__ in annotations, cls, accepted
+
+
+@dataclass(slots=True)
 class RegionEntry:
     """Configuration and state container for region instances in a distributed system.
 
@@ -24,6 +81,8 @@ class RegionEntry:
     - Recreate regions from stored state
     - Manage inter-region relationships
 
+    Entries are slotted, so assigning an attribute that is not a field raises AttributeError.
+
     Attributes:
         name (str): Unique identifier for the region. Default: None
         type (str): Fully qualified class name of the region implementation. Default: None
@@ -33,6 +92,7 @@ class RegionEntry:
         llm (LLMLink): Optional language model interface for generating responses. Default: None
         region (base_region.BaseRegion): Live instance of the region (populated when active). Default: None
         reply_with_actors (bool): Whether responses should include actor references. Default: None
+        max_inflight (int): Maximum number of concurrent backend calls for the region. Default: None
 
     Example:
         >>> entry = RegionEntry(name="customer_support", type="regions.SupportRegion")
@@ -49,6 +109,7 @@ class RegionEntry:
     reply_with_actors: bool = None
     delay: float = None
     threshold: float = None
+    max_inflight: int = None
 
     def __repr__(self):
         """Return debug-friendly representation showing region name.
@@ -70,7 +131,7 @@ class RegionEntry:
         """Populate entry attributes from a live region instance.
 
         Copies critical metadata and optional dependencies from a BaseRegion object.
-        Handles optional attributes (connections, rag, llm, reply_with_actors) safely via hasattr checks.
+        Optional attributes (see _OPTIONAL_ATTRS) are probed once each with getattr and a sentinel default.
 
         Args:
             region (base_region.BaseRegion): Source region instance to serialize
@@ -83,6 +144,7 @@ class RegionEntry:
             - llm (if present on region)
             - reply_with_actors (if present on region)
             - delay (if present on region)
+            - max_inflight (if present on region)
             - region (direct reference to source object)
 
         Example:
@@ -97,18 +159,10 @@ class RegionEntry:
         # self.type = type(region).__name__
 
         self.task = region.task
-        if hasattr(region, "connections"):
-            self.connections = region.connections
-        if hasattr(region, "rag"):
-            self.rag = region.rag
-        if hasattr(region, "llm"):
-            self.llm = region.llm
-        if hasattr(region, "reply_with_actors"):
-            self.reply_with_actors = region.reply_with_actors
-        if hasattr(region, "delay"):
-            self.delay = region.delay
-        if hasattr(region, "threshold"):
-            self.threshold = region.threshold
+        for attr in _OPTIONAL_ATTRS:
+            value = getattr(region, attr, _MISSING)
+            if value is not _MISSING:
+                setattr(self, attr, value)
         self.region = region
 
     @classmethod
@@ -128,6 +182,7 @@ class RegionEntry:
             - llm (if present on region)
             - reply_with_actors (if present on region)
             - delay (if present on region)
+            - max_inflight (if present on region)
             - region (direct reference to source object)
 
         Example:
@@ -142,7 +197,8 @@ class RegionEntry:
         """Instantiate a region from stored configuration.
 
         Recreates a region object using the entry's metadata and dependencies.
-        Uses partial application to build constructor arguments incrementally.
+        Collects constructor arguments into a single keyword dict before instantiation, passing only
+        the fields that are set (not None) and that the region class accepts.
 
         Behavior:
             - If region already exists: Logs recreation attempt
@@ -164,44 +220,36 @@ class RegionEntry:
             >>> assert isinstance(region, BaseRegion)
         """
         if self.region:
-            logging.info(f"Remaking '{self.name}' {self.type}")
-
-        f = partial(
-            class_from_str(self.type),
-            name=self.name,
-        )
-
-        if self.type != 'ListenerRegion':
-            f = partial(f, task=self.task)
-        if self.connections:
-            f = partial(f, connections=self.connections)
-        elif self.type != 'ListenerRegion':
-            f = partial(f, connections={})
-        if self.rag:
-            f = partial(f, rag=self.rag)
-        if self.llm:
-            f = partial(f, llm=self.llm)
-        if self.reply_with_actors:
-            f = partial(f, reply_with_actors=self.reply_with_actors)
-        if self.threshold:
-            f = partial(f, threshold=self.threshold)
-        if self.delay:
-            f = partial(f, delay=self.delay)
+            logging.info("Remaking '%s' %s", self.name, self.type)
+
+        _, _, cls, accepted = _type_needs(self.type)
+        kwargs = {"name": self.name}
+
+        if "task" in accepted:
+            kwargs["task"] = self.task
+        if "connections" in accepted:
+            kwargs["connections"] = self.connections or {}
+        for attr in _CONSTRUCTOR_ATTRS:
+            value = getattr(self, attr)
+            if value is not None and attr in accepted:
+                kwargs[attr] = value
 
         try:
-            self.region = f()
-            logging.info(f"Created '{self.name}' {self.type} from entry")
+            self.region = cls(**kwargs)
+            logging.info("Created '%s' %s from entry", self.name, self.type)
         except Exception as e:
-            logging.error(f"Exception while making '{self.name}' {self.type}: {e}")
+            logging.error("Exception while making '%s' %s: %s", self.name, self.type, e)
             return None
         return self.region
 
     @classmethod
-    def load_list(cls, path: str) -> List["RegionEntry"]:
+    def load_list(cls, path: str | os.PathLike) -> List["RegionEntry"]:
         """Load and validate region configuration from a JSON file.
 
                 Reads a JSON file containing serialized region entries and converts them into
-                RegionEntry objects. Enforces critical validation that all region names are unique
+                RegionEntry objects. The file is parsed from raw bytes, using orjson when it is
+                installed and the standard json module otherwise. Manifests larger than 1 MiB are
+                streamed entry by entry when ijson is installed. Enforces critical validation that all region names are unique
                 to prevent routing conflicts in the distributed system.
 
                 The JSON file must contain a list of dictionaries where each dictionary has keys
@@ -209,7 +257,7 @@ class RegionEntry:
                 fields will be initialized with None values per the dataclass defaults.
 
                 Args:
-                    path (str): File path to JSON configuration
+                    path (str | os.PathLike): File path to JSON configuration
 
                 Returns:
                     List[RegionEntry]: Validated list of region entry objects
@@ -221,8 +269,8 @@ class RegionEntry:
 
                 Validation:
                     Performs critical uniqueness check on region names:
-                    - Compares total entries against unique names (len vs set)
-                    - Fails immediately on duplicates to prevent system instability
+                    - Checks each name against those already seen while building entries
+                    - Fails on the first duplicate, naming it, to prevent system instability
 
                 Example:
                     >>> entries = RegionEntry.load_list("config/regions.json")
@@ -234,17 +282,22 @@ class RegionEntry:
                     must be created separately via RegionEntry.make_region(). The returned entries
                     contain no live region objects (region attribute remains None).
                 """
-        pure_path = pathlib.PurePath(path)
-
-        with open(str(pure_path), encoding="utf-8") as f:
-            raw_list = json.load(f)     # [{"name": ..., "type": ..., ...}, ...]
-            logging.info(f"Loaded {len(raw_list)} entries from '{pure_path.name}'")
-            name_roll = []
-            for entry in raw_list:
-                name_roll.append(entry['name'])
-            if len(name_roll) != len(set(name_roll)):
-                raise ValueError(f"Duplicate region names in list from '{pure_path.name}'")
-        return [cls(**item) for item in raw_list]
+        entries = []
+        seen = set()
+        with open(path, "rb") as f:
+            if ijson is not None and os.fstat(f.fileno()).st_size > _STREAM_THRESHOLD:
+                # Stream large manifests so a bad entry fails before the rest is parsed
+                raw_list = ijson.items(f, 'item', use_float=True)
+            else:
+                raw_list = _json_loads(f.read())     # [{"name": ..., "type": ..., ...}, ...]
+            for item in raw_list:
+                name = item['name']
+                if name in seen:
+                    raise ValueError(f"Duplicate region name '{name}' in list from '{os.path.basename(path)}'")
+                seen.add(name)
+                entries.append(cls(**item))
+        logging.info("Loaded %d entries from '%s'", len(entries), os.path.basename(path))
+        return entries
 
 class RegionRegistry:
     """Central registry for managing region instances in a distributed multi-agent system.
@@ -257,15 +310,14 @@ class RegionRegistry:
     - Managing inter-region relationships
 
     The registry maintains:
-    - A list of RegionEntry objects representing region configurations
-    - A parallel list of region names for quick lookup
+    - An insertion-ordered dict of RegionEntry objects keyed by region name
     - Default RAG and LLM instances for regions that don't specify their own
     - A 'live' flag indicating whether regions have been instantiated
     Note: 'live' flag is not yet fully supported
 
     Attributes:
-        regions (List[RegionEntry]): Configuration entries for all registered regions
-        names (List[str]): Names of all registered regions (parallel to regions list)
+        regions (List[RegionEntry]): Copy of the configuration entries for all registered regions; assign to replace them
+        names (List[str]): Copy of the names of all registered regions, in registration order
         live (bool): Whether regions have been built into live instances
         default_rag (DynamicRAGSystem): Default RAG system for regions without their own
         default_llm (LLMLink): Default LLM interface for regions without their own
@@ -279,8 +331,8 @@ class RegionRegistry:
     """
     def __init__(self,
                  region_list: List[RegionEntry] = None,
-                 default_rag: DynamicRAGSystem = DynamicRAGSystem(),
-                 default_llm: LLMLink = LLMLink(),
+                 default_rag: DynamicRAGSystem = None,
+                 default_llm: LLMLink = None,
     ):
         """Initialize the region registry with optional configuration.
 
@@ -288,25 +340,63 @@ class RegionRegistry:
             region_list (List[RegionEntry], optional): Initial list of region configurations.
                 Defaults to empty list if None.
             default_rag (DynamicRAGSystem, optional): Default RAG system for regions that
-                don't specify their own. Defaults to a new DynamicRAGSystem instance.
+                don't specify their own. Defaults to a new DynamicRAGSystem instance, created on first use.
             default_llm (LLMLink, optional): Default LLM interface for regions that don't
-                specify their own. Defaults to a new LLMLink instance.
+                specify their own. Defaults to a new LLMLink instance, created on first use.
 
         Note:
-            - The registry maintains two parallel lists: regions and names
+            - Entries are stored in a dict keyed by name; regions and names return list copies of it
             - live flag tracks whether regions have been instantiated
             - default_rag and default_llm provide fallback dependencies
         """
-        if not region_list:
-            self.regions: List[RegionEntry] = []
-            self.names = []
-        else:
+        self._by_name: dict[str, RegionEntry] = {}
+        if region_list:
             self.regions = region_list
-            self._update_names()
         self.live = False
-        self.default_rag = default_rag
-        self.default_llm = default_llm
+        self._default_rag = default_rag
+        self._default_llm = default_llm
+
+    @property
+    def default_rag(self) -> DynamicRAGSystem:
+        """Default RAG system, created on first access if none was given."""
+        if self._default_rag is None:
+            self._default_rag = DynamicRAGSystem()
+        return self._default_rag
+
+    @default_rag.setter
+    def default_rag(self, rag: DynamicRAGSystem):
+        self._default_rag = rag
+
+    @property
+    def default_llm(self) -> LLMLink:
+        """Default LLM interface, created on first access if none was given."""
+        if self._default_llm is None:
+            self._default_llm = LLMLink()
+        return self._default_llm
+
+    @default_llm.setter
+    def default_llm(self, llm: LLMLink):
+        self._default_llm = llm
+
+    @property
+    def regions(self) -> List[RegionEntry]:
+        """New list of registered region entries, in registration order.
+
+        Changes to the returned list are not written back; assign a list to replace the entries.
+        """
+        return list(self._by_name.values())
+
+    @regions.setter
+    def regions(self, region_list: List[RegionEntry]):
+        """Replace all registered entries, keying them by their names."""
+        self._by_name = {entry.name: entry for entry in region_list}
+        if len(self._by_name) != len(region_list):
+            logging.warning("Dropped %d entries with duplicate names", len(region_list) - len(self._by_name))
 
+    @property
+    def names(self) -> List[str]:
+        """New list of registered region names, in registration order."""
+        return list(self._by_name)
 
     def __len__(self):
         """Return the number of registered regions.
@@ -314,7 +404,7 @@ class RegionRegistry:
         Returns:
             int: Count of region configurations in the registry
         """
-        return len(self.regions)
+        return len(self._by_name)
 
     def __getitem__(self, item: str):
         """Retrieve a live region instance by name.
@@ -333,7 +423,10 @@ class RegionRegistry:
             >>> region = registry["customer_support"]
             >>> region.make_replies()
         """
-        return self.regions[self.names.index(item)].region
+        try:
+            return self._by_name[item].region
+        except KeyError:
+            raise ValueError(f"'{item}' is not in registry") from None
 
     def __setitem__(self, key: str, value: BaseRegion):
         """Register or update a region in the registry.
@@ -345,17 +438,15 @@ class RegionRegistry:
         Side Effects:
             - Creates a RegionEntry from the region instance
             - Sets the region's name to match the key
-            - Registers the entry in the registry
+            - Adds the entry under the key, replacing any entry already registered there
 
         Example:
             >>> registry["customer_support"] = support_region_instance
         """
-        entry = RegionEntry()
-        entry.from_region(value)
-        entry.name = key
-        entry.region.name = key
-        self.register(entry)
-        self.update(entry)          # If a region is already present, update it instead
+        value.name = key
+        entry = RegionEntry.make(value)
+        self._by_name[key] = entry
+        logging.info("Region '%s' set", key)
 
     def __delitem__(self, key: str):
         """Strike an item from the registry.
@@ -378,7 +469,7 @@ class RegionRegistry:
             >>> for entry in registry:
             ...     print(f"Region: {entry.name}")
         """
-        return iter(self.regions)
+        return iter(self._by_name.values())
 
     def __reversed__(self):
         """Iterate over all region entries in the registry, in reversed order.
@@ -386,16 +477,15 @@ class RegionRegistry:
         Returns:
             Iterator[RegionEntry]: Iterator over RegionEntry objects
         """
-        return reversed(self.regions)
+        return reversed(self._by_name.values())
 
     def _update_names(self):
-        """Update the list of region names from the current regions list.
+        """Re-key registered entries by their current names.
 
         Side Effects:
-            - Rebuilds self.names list from self.regions
+            - Rebuilds the name index, picking up entries renamed since registration
         """
-        self.names = []
-        for entry in self.regions: self.names.append(entry.name)
+        self._by_name = {entry.name: entry for entry in self._by_name.values()}
 
     def register(self, region: RegionEntry) -> bool:
         """Register a new region configuration in the registry.
@@ -407,19 +497,17 @@ class RegionRegistry:
             bool: True if registration succeeded, False if region already exists
 
         Side Effects:
-            - Adds region to self.regions list
-            - Adds region name to self.names list
+            - Adds region to the registry under its name
 
         Example:
             >>> entry = RegionEntry(name="sales", type="regions.SalesRegion")
             >>> registry.register(entry)
         """
-        if region.name not in self.names:
-            self.names.append(region.name)
-            self.regions.append(region)
-            logging.info(f"Region '{region.name}' registered")
+        if region.name not in self._by_name:
+            self._by_name[region.name] = region
+            logging.info("Region '%s' registered", region.name)
             return True
-        logging.warning(f"Region '{region.name}' already registered")
+        logging.warning("Region '%s' already registered", region.name)
         return False
 
     def update(self, region: RegionEntry):
@@ -432,19 +520,18 @@ class RegionRegistry:
                     bool: True if update succeeded, False if region not found
 
                 Side Effects:
-                    - Replaces existing region entry with the new one
+                    - Replaces existing region entry with the new one, keeping its position
 
                 Example:
                     >>> entry = registry.regions[0]
                     >>> entry.task = "Updated task description"
                     >>> registry.update(entry)
         """
-        if region.name not in self.names:
-            logging.warning(f"Region '{region.name}' not found in registry")
+        if region.name not in self._by_name:
+            logging.warning("Region '%s' not found in registry", region.name)
             return False
-        self.deregister(region.name)
-        self.register(region)
-        logging.info(f"Region '{region.name}' updated")
+        self._by_name[region.name] = region
+        logging.info("Region '%s' updated", region.name)
         return True
 
     def deregister(self, name: str) -> bool:
@@ -457,64 +544,57 @@ class RegionRegistry:
             bool: True if region was removed, False if not found
 
         Side Effects:
-            - Removes region from self.regions list
-            - Removes name from self.names list
+            - Removes the region registered under this name, or an entry renamed to it in place
             - Logs a warning if the name is not registered
-            - Will find and remove a named region even if it is absent from the name list
 
         Example:
             >>> registry.deregister("customer_support")
         """
-        removed = False
-        for region in self.regions:
-            if region.name == name:
-                self.regions.remove(region)
-                self.names.remove(name)
-                removed = True
-                break
+        if name not in self._by_name:
+            # Entries renamed without re-keying are still found by their current name
+            name = next((key for key, entry in self._by_name.items() if entry.name == name), name)
+        removed = self._by_name.pop(name, None) is not None
         if not removed:
-            logging.warning(f"No region '{name}' in registry")
+            logging.warning("No region '%s' in registry", name)
         return removed
 
-    def load(self, path: str) -> bool:
+    def load(self, path: str | os.PathLike) -> bool:
         """Load region configurations from a JSON file.
 
         Args:
-            path (str): Path to JSON configuration file
+            path (str | os.PathLike): Path to JSON configuration file
 
         Returns:
             bool: True if loading succeeded, False otherwise
 
         Side Effects:
-            - Replaces current regions list with loaded configurations
-            - Updates names list based on loaded configurations
+            - Replaces current registry contents with loaded configurations
 
         Example:
             >>> registry.load("config/regions.json")
         """
-        pure_path = pathlib.PurePath(path)
+        pure_path = pathlib.PurePath(path)      # For messages only
 
         try:
-            self.regions = RegionEntry.load_list(str(pure_path))
+            self.regions = RegionEntry.load_list(path)
         except FileNotFoundError:
-            logging.error(f"File '{pure_path.name}' not found at '{str(pure_path.parent)}'.")
+            logging.error("File '%s' not found at '%s'.", pure_path.name, pure_path.parent)
             return False
         except json.decoder.JSONDecodeError:
-            logging.error(f"File '{pure_path.name}' not valid JSON.")
+            logging.error("File '%s' not valid JSON.", pure_path.name)
             return False
         except Exception as e:
-            logging.error(f"Problem loading file '{pure_path.name}' from '{str(pure_path.parent)}': {e}")
+            logging.error("Problem loading file '%s' from '%s': %s", pure_path.name, pure_path.parent, e)
             return False
 
-        self._update_names()
-        logging.info(f"Registered regions from '{pure_path.name}' at '{str(pure_path.parent)}'")
+        logging.info("Registered regions from '%s' at '%s'", pure_path.name, pure_path.parent)
         return True
 
     def verify(self) -> tuple[int, int]:
         """Verify registry consistency and configuration validity.
 
         Checks for:
-        - Matching counts of regions and names
+        - Entries renamed since registration without re-keying
         - Valid region types (must be subclass of BaseRegion)
         - Required fields (type, task)
         - Valid connections to other regions
@@ -530,74 +610,54 @@ class RegionRegistry:
             >>> if not issues:
             ...     registry.build_regions()
         """
-        logging.info("Verifying registry...")
-        issues = []
-        warnings = []
-        names_from_entries = []
-
         # Are there regions to verify?
-        if not self.regions:
+        if not self._by_name:
             logging.info("No regions registered")
-            return len(issues), len(warnings)
-
-        # Is there the same number of names as regions?
-        logging.info(f"Found {len(self.regions)} regions and {len(self.names)} names")
+            return 0, 0
 
-        # Check they're 1:1, irrespective of order
-
-        for entry in self.regions:
-            names_from_entries.append(entry.name)
-
-        if len(self.regions) != len(self.names):
-            orphaned_regions = set(names_from_entries) - set(self.names)
-            orphaned_names = set(self.names) - set(names_from_entries)
-            if orphaned_regions:
-                issues.append(f"Found {len(orphaned_regions)} orphaned regions: {', '.join(list(orphaned_regions))}")
-            if orphaned_names:
-                issues.append(f"Found {len(orphaned_names)} orphaned names: {', '.join(list(orphaned_names))}")
-
-        # Keep verifying regardless
-
-        # Reconcile region name of each entry with names list
-        for region in self.regions:
-            if region.name not in self.names:
-                issues.append(f"Region '{region.name}' present, but not found in name list")
+        logging.info("Verifying registry...")
+        issues = []
+        warnings = []
+        logging.info("Found %d regions", len(self._by_name))
+
+        # Reconcile region name of each entry with the name it is registered under
+        for name, region in self._by_name.items():
+            if region.name != name:
+                issues.append(f"Region '{region.name}' present, but registered under name '{name}'")
+            # Resolve the type once; dependency checks only apply to resolvable types
+            needs_rag = needs_llm = False
             if not region.type:
                 issues.append(f"No type given for region '{region.name}'")
             else:
                 try:
-                    class_from_str(region.type)
+                    needs_rag, needs_llm, _, _ = _type_needs(region.type)
                 except (TypeError, NameError) as e:
                     issues.append(f"'{region.name}': {e}")
             if not region.task and region.type != 'ListenerRegion':
                 issues.append(f"No task given for region '{region.name}'")
-            param_string = str(inspect.signature(class_from_str(region.type)).parameters)
-            if 'DynamicRAGSystem' in param_string:
+            if needs_rag:
                 if not region.rag:
                     warnings.append(f"No RAG given for region '{region.name}' - will set default on build")
-            if 'LLMLink' in param_string:
+            if needs_llm:
                 if not region.llm:
                     warnings.append(f"No LLM given for region '{region.name}' - will set default on build")
             if region.connections:
-                for connection in region.connections.keys():
-                    if region.type == 'ListenerRegion':
-                        issues.append("Connection to '{connection}' specified for ListenerRegion '{region.name}', but ListenerRegion instances do not support outgoing connections")
-                    if not connection in self.names:
-                        issues.append(f"Connection to '{connection}' specified for '{region.name}', but no such region in name list")
+                if region.type == 'ListenerRegion':
+                    for connection in region.connections:
+                        issues.append(f"Connection to '{connection}' specified for ListenerRegion '{region.name}', but ListenerRegion instances do not support outgoing connections")
+                # Unknown targets via one set difference, sorted for a stable issue order
+                for connection in sorted(region.connections.keys() - self._by_name.keys()):
+                    issues.append(f"Connection to '{connection}' specified for '{region.name}', but no such region in name list")
             else:
                 if region.type != 'ListenerRegion':
-                    logging.info(f"No outgoing connections specified from region '{region.name}'")
+                    logging.info("No outgoing connections specified from region '%s'", region.name)
 
         if issues:
-            logging.error(f"Verification failed: {len(issues)} issues")
-            for issue in issues:
-                logging.error(issue)
+            logging.error("Verification failed: %d issues\n  - %s", len(issues), "\n  - ".join(issues))
         else:
             logging.info("Verification passed")
         if warnings:
-            logging.warning(f"{len(warnings)} warnings")
-            for warning in warnings:
-                logging.warning(warning)
+            logging.warning("%d warnings\n  - %s", len(warnings), "\n  - ".join(warnings))
         return len(issues), len(warnings)
 
     def build_regions(self, overwrite: bool = False, verify = True) -> bool:
@@ -622,6 +682,10 @@ class RegionRegistry:
                     >>> if success:
                     ...     print("All regions built successfully")
                 """
+        if not self._by_name:
+            logging.error("No regions registered")
+            return False
+
         # Verify before building
         if verify:
             issues, warnings = self.verify()
@@ -630,14 +694,11 @@ class RegionRegistry:
         if issues:
             logging.error("Build cancelled due to verification issues. Address these before proceeding, or disable verification.")
             return False
-        if not self.regions:
-            logging.error("No regions registered")
-            return False
 
         # Start build
         if warnings:
-            logging.info(f"Proceeding despite {warnings} warnings")
-        logging.info(f"Attempting to build {len(self.regions)} regions...")
+            logging.info("Proceeding despite %d warnings", warnings)
+        logging.info("Attempting to build %d regions...", len(self._by_name))
         built = 0
         skipped = 0
         faultless = True
@@ -647,19 +708,19 @@ class RegionRegistry:
             # Do not overwrite existing region info if overwrite disabled
             if entry.region and not overwrite:
                 skipped += 1
-                logging.info(f"Skipping build of region '{entry.name}'")
+                logging.info("Skipping build of region '%s'", entry.name)
 
             else:
                 # Assign default RAG and/or LLM as threatened in 'verify'
-                param_string = str(inspect.signature(class_from_str(entry.type)).parameters)
-                if 'DynamicRAGSystem' in param_string:
+                needs_rag, needs_llm, _, _ = _type_needs(entry.type)
+                if needs_rag:
                     if not entry.rag:
                         entry.rag = self.default_rag
-                        logging.info(f"RAG set to default for region '{entry.name}'")
-                if 'LLMLink' in param_string:
+                        logging.info("RAG set to default for region '%s'", entry.name)
+                if needs_llm:
                     if not entry.llm:
                         entry.llm = self.default_llm
-                        logging.info(f"LLM set to default for region '{entry.name}'")
+                        logging.info("LLM set to default for region '%s'", entry.name)
 
                 # Try actually building the region
                 try:
@@ -667,23 +728,17 @@ class RegionRegistry:
                         built += 1
                     else:
                         faultless = False
-                        logging.error(f"Failed to build region '{entry.name}'")
+                        logging.error("Failed to build region '%s'", entry.name)
                 except Exception as e:
-                    logging.error(f"Failed to build region '{entry.name}': {e}")
+                    logging.error("Failed to build region '%s': %s", entry.name, e)
                     faultless = False
 
         # Wrap-up and final tally
-        print("Build operation done.")
-        if overwrite:
-            logging.info(f"Successfully built {built} out of {len(self.regions)} regions.")
-        else:
-            if not skipped:
-                logging.info(f"Successfully built {built} out of {len(self.regions)} regions.")
-            else:
-                logging.info(f"Skipped {skipped} out of {len(self.regions)} regions.")
-                logging.info(f"Built {built} out of {len(self.regions)} regions.")
-        if built + skipped != len(self.regions):
-            logging.error(f"Failed to build {len(self.regions) - built - skipped} out of {len(self.regions)} regions.")
+        total = len(self._by_name)
+        failed = total - built - skipped
+        if failed:
             faultless = False
+        logging.log(logging.ERROR if failed else logging.INFO,
+                    "Build done: built %d, skipped %d, failed %d out of %d regions", built, skipped, failed, total)
 
         return faultless
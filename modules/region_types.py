@@ -16,20 +16,30 @@ region_dictionary = [
     {"name": "MockListenerRegion", "class": MockListenerRegion}
 ]
 
+# Name <-> class indexes over region_dictionary, built from the end so the first matching entry wins
+_name_to_class: dict[str, type] = {e["name"]: e["class"] for e in reversed(region_dictionary)}
+_class_to_name: dict[type, str] = {e["class"]: e["name"] for e in reversed(region_dictionary)}
+
+def register_region_type(name: str, region_class: type[BaseRegion]) -> None:
+    """Add a region type to region_dictionary and the lookup indexes. Existing names and classes keep their entry."""
+    region_dictionary.append({"name": name, "class": region_class})
+    _name_to_class.setdefault(name, region_class)
+    _class_to_name.setdefault(region_class, name)
+
 def class_from_str(class_name: str) -> type[BaseRegion]:
-    for region_type in region_dictionary:
-        if region_type["name"] == class_name:
-            if issubclass(region_type["class"], BaseRegion):
-                return region_type["class"]
-            else:
-                raise TypeError(f"'{class_name}' is not a subclass of BaseRegion")
-    raise NameError(f"'{class_name}' is not a defined region type")
+    try:
+        region_class = _name_to_class[class_name]
+    except KeyError:
+        raise NameError(f"'{class_name}' is not a defined region type") from None
+    if not issubclass(region_class, BaseRegion):
+        raise TypeError(f"'{class_name}' is not a subclass of BaseRegion")
+    return region_class
 
 def class_str_from_instance(instance: BaseRegion) -> str:
-    for region_type in region_dictionary:
-        if type(instance) is region_type["class"]:
-            return region_type["name"]
-    raise NameError(f"'{type(instance)}' is not associated with a string reference")
+    try:
+        return _class_to_name[type(instance)]
+    except KeyError:
+        raise NameError(f"'{type(instance)}' is not associated with a string reference") from None
 
     # Alternate code:
     # return region_types[[x['name'] for x in region_types].index('RAGRegion')]["class"]
\ No newline at end of file
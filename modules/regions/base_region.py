@@ -1,5 +1,22 @@
 import asyncio
 import logging
+from collections import deque
+from typing import TypedDict
+
+from utils import drain_queue
+
+_INBOX_LOG_LEVELS = {'request': logging.INFO, 'reply': logging.DEBUG}
+
+
+class Message(TypedDict):
+    """
+    Shape of a message passed between regions. Kept as a plain dict because the
+    Postmaster rewrites messages in place when rerouting or returning them.
+    """
+    source: str
+    destination: str
+    content: str
+    role: str
 
 
 class BaseRegion:
@@ -15,11 +32,13 @@ class BaseRegion:
         connections (dict[str, str]): Mapping of region names to task descriptions
         inbox (asyncio.Queue): Incoming message queue
         outbox (asyncio.Queue): Outgoing message queue
-        _incoming_requests (dict): Stores pending requests (keyed by source)
-        _incoming_replies (dict): Stores received replies (keyed by source)
+        _incoming_requests (deque): Pending requests as (source, content) tuples
+        _incoming_replies (deque): Received replies as (source, content) tuples
+        max_inflight (int): Maximum number of concurrent backend (LLM/RAG) calls
+        _sem (asyncio.Semaphore): Caps concurrent backend (LLM/RAG) calls at max_inflight
     """
 
-    def __init__(self, name: str, task: str, connections: dict[str, str] | None = None):
+    def __init__(self, name: str, task: str, connections: dict[str, str] | None = None, max_inflight: int = 8):
         """
         Initialize common communication infrastructure.
 
@@ -27,6 +46,7 @@ class BaseRegion:
             name (str): Unique identifier for the region
             task (str): Functional description of the region's purpose
             connections (dict[str, str] | None): Region-to-task mapping
+            max_inflight (int): Maximum number of concurrent backend calls. Defaults to 8.
             **kwargs: Additional parameters for child classes
 
         Note:
@@ -37,10 +57,27 @@ class BaseRegion:
         self.name = name
         self.task = task
         self.connections = connections if connections is not None else {}
+        # Shared with other tasks: ListenerRegion awaits inbox.get() and the Postmaster drains outboxes
         self.inbox = asyncio.Queue()
         self.outbox = asyncio.Queue()
-        self._incoming_requests = asyncio.Queue()  # Stores requests (keyed by source)
-        self._incoming_replies = asyncio.Queue()  # Stores replies (keyed by source)
+        # Stores (source, request) and (source, reply) tuples; both are consumed synchronously, so no asyncio.Queue
+        self._incoming_requests = deque()
+        self._incoming_replies = deque()
+        self.max_inflight = max_inflight
+        self._sem = asyncio.Semaphore(max_inflight)
+
+    async def _guarded(self, coro):
+        """
+        Await a backend coroutine while holding the region's concurrency semaphore.
+
+        Args:
+            coro: Awaitable backend call (e.g. an LLM or RAG request)
+
+        Returns:
+            The result of the awaited coroutine
+        """
+        async with self._sem:
+            return await coro
 
     def _post(self, destination: str, content: str, role: str) -> None:
         """
@@ -55,7 +92,7 @@ class BaseRegion:
             - Constructs standardized message dictionary
             - Non-blocking queue insertion
         """
-        message = {
+        message: Message = {
             "source": self.name,
             "destination": destination,
             "content": content,
@@ -73,6 +110,22 @@ class BaseRegion:
         """
         self._post(destination, query_text, 'request')
 
+    def _ask_many(self, destinations, query_text: str) -> None:
+        """
+        Send the same request query to several regions.
+
+        Args:
+            destinations (Iterable[str]): Target region names
+            query_text (str): Question to ask
+
+        Note:
+            - Builds the shared message fields once and copies them per destination
+        """
+        template = {"source": self.name, "content": query_text, "role": 'request'}
+        for destination in destinations:
+            message: Message = {**template, "destination": destination}
+            self.outbox.put_nowait(message)
+
     def _reply(self, destination: str, reply_text: str) -> None:
         """
         Send reply to a requesting region.
@@ -88,20 +141,27 @@ class BaseRegion:
         Process all pending messages in inbox queue.
 
         Note:
+            - Returns immediately when the inbox is empty
+            - Drains the inbox in a single step rather than message by message
             - Categorizes messages into requests/replies
-            - Stores messages in standardized dictionaries
-            - Handles unknown roles via AssertionError
-        """
-        while not self.inbox.empty():
-            message = self.inbox.get_nowait()
-            if message['role'] == 'request':
-                logging.info(f"{self.name}: Received request from {message['source']}: {message['content']}")
-                self._incoming_requests.put_nowait({message['source']: message['content']})
-            elif message['role'] == 'reply':
-                logging.debug(f"{self.name}: Received reply from {message['source']}: {message['content']}")
-                self._incoming_replies.put_nowait({message['source']: message['content']})
-            else:
-                raise AssertionError(f"{self.name}: Unknown message role: {message['role']}")
+            - Stores messages as (source, content) tuples
+            - Handles unknown roles via AssertionError, returning the messages after it to the inbox
+        """
+        if self.inbox.empty():
+            return
+        name = self.name
+        stores = {'request': self._incoming_requests.append, 'reply': self._incoming_replies.append}
+        messages = drain_queue(self.inbox)
+        while messages:
+            message = messages.popleft()
+            role, source, content = message['role'], message['source'], message['content']
+            if role not in stores:
+                # Leave the unprocessed messages queued, as if they had been taken one at a time
+                for remaining in messages:
+                    self.inbox.put_nowait(remaining)
+                raise AssertionError(f"{name}: Unknown message role: {role}")
+            logging.log(_INBOX_LOG_LEVELS[role], "%s: Received %s from %s: %s", name, role, source, content)
+            stores[role]((source, content))
 
     def keep_last_reply_per_source(self) -> None:
         """
@@ -115,18 +175,14 @@ class BaseRegion:
                     - Overwrites previous replies from the same source with the latest one
                     - Logs the number of pruned replies
         """
-        if self._incoming_replies.empty():
+        if not self._incoming_replies:
             logging.info(f"{self.name}: No incoming replies to prune.")
             return
-        replies = {}
-        original_length = self._incoming_replies.qsize()
-        while not self._incoming_replies.empty():
-            replies.update(self._incoming_replies.get_nowait())
-            self._incoming_replies.task_done()
-        for source in replies:
-            self._incoming_replies.put_nowait({source: replies[source]})
+        original_length = len(self._incoming_replies)
+        # Later replies overwrite earlier ones; sources keep the position of their first reply
+        self._incoming_replies = deque(dict(self._incoming_replies).items())
         logging.info(
-            f"{self.name}: Pruned {original_length - self._incoming_replies.qsize()} replies. {self._incoming_replies.qsize()} replies remaining.")
+            f"{self.name}: Pruned {original_length - len(self._incoming_replies)} replies. {len(self._incoming_replies)} replies remaining.")
 
     def _consolidate_replies(self) -> None:
         """
@@ -140,24 +196,19 @@ class BaseRegion:
                     - Maintains source-specific reply grouping
                     - Logs the consolidation statistics
         """
-        if self._incoming_replies.empty():
+        if not self._incoming_replies:
             logging.info(f"{self.name}: No incoming replies to consolidate.")
             return
         replies = {}
-        original_length = self._incoming_replies.qsize()
-        while not self._incoming_replies.empty():
-            item = self._incoming_replies.get_nowait()
-            source = next(iter(item.keys()))
-            content = item[source]
-            if source in replies.keys():
-                new_content = replies[source] + '\n' + content
+        original_length = len(self._incoming_replies)
+        for source, content in self._incoming_replies:
+            if source in replies:
+                replies[source] += '\n' + content
             else:
-                new_content = content
-            replies.update({source: new_content})
-        for source in replies:
-            self._incoming_replies.put_nowait({source: replies[source]})
+                replies[source] = content
+        self._incoming_replies = deque(replies.items())
         logging.info(
-            f"{self.name}: Consolidated {original_length} replies into {self._incoming_replies.qsize()} replies total.")
+            f"{self.name}: Consolidated {original_length} replies into {len(self._incoming_replies)} replies total.")
 
     def clear_replies(self) -> None:
         """
@@ -169,10 +220,8 @@ class BaseRegion:
             - Does not affect request queues
             - Logs confirmation if queue was empty
         """
-        if self._incoming_replies.empty():
+        if not self._incoming_replies:
             logging.info(f"{self.name}: Reply queue already empty.")
             return
-        while not self._incoming_replies.empty():
-            self._incoming_replies.get_nowait()
-            self._incoming_replies.task_done()
+        self._incoming_replies.clear()
         logging.info(f"{self.name}: All replies cleared.")
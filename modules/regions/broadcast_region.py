@@ -1,6 +1,9 @@
 import logging
 
-from regions.base_region import BaseRegion
+from regions.base_region import BaseRegion, Message
+from utils import drain_queue
+
+_BROADCAST_ROLES = ('request', 'reply')
 
 
 class BroadcastRegion(BaseRegion):
@@ -54,6 +57,9 @@ class BroadcastRegion(BaseRegion):
     def _ask(self, destination: str, query_text: str) -> None:
         raise NotImplementedError("BroadcastRegion cannot generate requests")
 
+    def _ask_many(self, destinations, query_text: str) -> None:
+        raise NotImplementedError("BroadcastRegion cannot generate requests")
+
     def _reply(self, destination: str, reply_text: str) -> None:
         raise NotImplementedError("BroadcastRegion cannot generate replies")
 
@@ -70,7 +76,7 @@ class BroadcastRegion(BaseRegion):
             content (str): Message content to forward
             role (str): Message type ('request' or 'reply')
         """
-        message = {
+        message: Message = {
             "source": source,
             "destination": destination,
             "content": content,
@@ -78,23 +84,55 @@ class BroadcastRegion(BaseRegion):
         }
         self.outbox.put_nowait(message)
 
+    def _pipe_many(self, source: str, destinations, content: str, role: str):
+        """
+        Internal method to forward a message from a configurable source to several recipients.
+
+        Args:
+            source (str): Source region name
+            destinations (Iterable[str]): Target region names
+            content (str): Message content to forward
+            role (str): Message type ('request' or 'reply')
+
+        Note:
+            - Builds the shared message fields once and copies them per destination
+        """
+        template = {"source": source, "content": content, "role": role}
+        put = self.outbox.put_nowait
+        for destination in destinations:
+            message: Message = {**template, "destination": destination}
+            put(message)
+
     def broadcast(self) -> None:
         """
         Process all messages in the inbox and broadcast them to all connected regions.
 
         This method:
-        1. Processes messages until inbox is empty
-        2. Logs each message with appropriate level (INFO for requests, DEBUG for replies)
+        1. Drains the inbox in a single step
+        2. Logs each message at DEBUG level and a single INFO summary per call
         3. Forwards each message to all regions specified in 'connections'
         4. Preserves all original message metadata (source, destination, role)
+
+        An unknown role raises AssertionError; messages queued after it are returned to the inbox.
         """
-        while not self.inbox.empty():
-            message = self.inbox.get_nowait()
-            if message['role'] == 'request':
-                logging.info(f"{self.name}: Broadcasting request from {message['source']}: {message['content']}")
-            elif message['role'] == 'reply':
-                logging.debug(f"{self.name}: Broadcasting reply from {message['source']}: {message['content']}")
-            else:
-                raise AssertionError(f"{self.name}: Unknown message role: {message['role']}")
-            for recipient in [*self.connections.keys()]:
-                self._pipe(message['source'], recipient, message['content'], message['role'])
+        name = self.name
+        recipients = tuple(self.connections)
+        counts = dict.fromkeys(_BROADCAST_ROLES, 0)
+        messages = drain_queue(self.inbox)
+        try:
+            while messages:
+                message = messages.popleft()
+                role, source, content = message['role'], message['source'], message['content']
+                if role not in counts:
+                    # Leave the unprocessed messages queued, as if they had been taken one at a time
+                    for remaining in messages:
+                        self.inbox.put_nowait(remaining)
+                    raise AssertionError(f"{name}: Unknown message role: {role}")
+                counts[role] += 1
+                logging.debug("%s: Broadcasting %s from %s: %s", name, role, source, content)
+                self._pipe_many(source, recipients, content, role)
+        finally:
+            # Summarize whatever was forwarded, including before an unknown role stopped the loop
+            if counts['request'] or counts['reply']:
+                logging.info("%s: Broadcast %d requests, %d replies to %d recipients",
+                             name, counts['request'], counts['reply'], len(recipients))
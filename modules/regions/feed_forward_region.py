@@ -2,6 +2,7 @@
 Rather than replying, this region feeds all output forward to all connections.
 """
 import logging
+from collections import deque
 
 from llmlink import LLMLink
 from regions.region import Region
@@ -9,8 +10,8 @@ from utils import make_prompt
 
 
 class FeedForwardRegion(Region):
-    def __init__(self, name: str, task: str, llm: LLMLink, connections: dict[str, str] | None):
-        super().__init__(name, task, llm, connections)
+    def __init__(self, name: str, task: str, llm: LLMLink, connections: dict[str, str] | None, max_inflight: int = 8):
+        super().__init__(name, task, llm, connections, max_inflight)
 
     async def make_replies(self) -> bool:
         """
@@ -23,6 +24,8 @@ class FeedForwardRegion(Region):
         Note:
             - Processes each pending request from _incoming_requests
             - Generates replies using LLM with region-specific context
+            - The background is built once per batch, so all prompts share the same prefix
+            - Pending requests are sent to the LLM as one batch, falling back to concurrent calls
             - Sends replies via _reply() method to all connected regions
             - Returns False if any LLM processing fails
             - Clears _incoming_requests after processing
@@ -33,18 +36,15 @@ class FeedForwardRegion(Region):
             logging.info(f"{self.name}: No incoming requests to process.")
             return True
 
-        initial_length = self._incoming_requests.qsize()
-        while not self._incoming_requests.empty():
-            request = self._incoming_requests.get_nowait()
-            source, question = request.popitem()
+        initial_length = len(self._incoming_requests)
+        # Build the background once so every prompt in the batch shares an identical prefix
+        background = self._background()
+        requests, self._incoming_requests = self._incoming_requests, deque()
+        prompts = [make_prompt(question, background) for _, question in requests]
 
-            prompt = make_prompt(
-                question,
-                '\n'.join([self.focus_str, self._replies_block(), self._requests_block()])
-            )
-
-            reply = await self._get_from_llm(prompt)
+        replies = await self._get_batch_from_llm(prompts)
 
+        for reply in replies:
             if reply:
                 for recipient in [*self.connections.keys()]:
                     self._reply(recipient, reply)
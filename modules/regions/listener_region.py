@@ -73,6 +73,9 @@ class ListenerRegion(BaseRegion):
     def _ask(self, destination: str, query_text: str) -> None:
         raise NotImplementedError("ListenerRegion does not support sending requests.")
 
+    def _ask_many(self, destinations, query_text: str) -> None:
+        raise NotImplementedError("ListenerRegion does not support sending requests.")
+
     def _reply(self, destination: str, reply_text: str) -> None:
         raise NotImplementedError("ListenerRegion does not support sending replies.")
 
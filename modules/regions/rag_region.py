@@ -1,9 +1,14 @@
+import asyncio
 import json
 import logging
+from collections import deque
+from itertools import takewhile
 
 from regions.base_region import BaseRegion
 from modules.dynamic_rag import DynamicRAGSystem, RetrievalResult
 
+SUMMARY_REQUEST = "Summarize the knowledge you have."
+
 
 class RAGRegion(BaseRegion):
     """
@@ -22,8 +27,8 @@ class RAGRegion(BaseRegion):
         reply_with_actors (bool): Whether to include actor metadata in replies (default: False)
         inbox (asyncio.Queue): Queue for incoming messages (requests and replies)
         outbox (asyncio.Queue): Queue for outgoing messages (requests and replies)
-        _incoming_requests (dict): Stores pending requests received from other regions (keyed by source region name)
-        _incoming_replies (dict): Stores pending replies received from other regions (keyed for knowledge updates)
+        _incoming_requests (deque): Pending requests received from other regions, as (source, content) tuples
+        _incoming_replies (deque): Pending replies received from other regions for knowledge updates, as (source, content) tuples
     """
 
     def __init__(self,
@@ -33,6 +38,7 @@ class RAGRegion(BaseRegion):
                  connections: dict[str,str] | None,
                  reply_with_actors: bool = False,
                  threshold: float = 0.5,
+                 max_inflight: int = 8,
                  ):
 
         """
@@ -46,6 +52,7 @@ class RAGRegion(BaseRegion):
                 If None, initializes with empty connections dictionary.
             reply_with_actors (bool, optional): Whether to include actor metadata in replies. Defaults to False.
             threshold (float, optional): Minimum similarity score. Defaults to 0.5.
+            max_inflight (int, optional): Maximum number of concurrent RAG calls. Defaults to 8.
 
         Note:
             - The region maintains separate queues for incoming/outgoing messages
@@ -53,11 +60,27 @@ class RAGRegion(BaseRegion):
             - _incoming_requests stores incoming requests for reply generation
             - _incoming_replies stores incoming replies for knowledge database updates
         """
-        super().__init__(name, task, connections)
+        super().__init__(name, task, connections, max_inflight)
         self.rag = rag
         self.reply_with_actors = reply_with_actors
         self.threshold = float(threshold)
 
+    async def _retrieve_for(self, sources: list[str], question: str) -> tuple:
+        """
+        Retrieve fragments similar to a question, tagging the result with the requesting sources.
+
+        Args:
+            sources (list[str]): Names of the regions that asked this question
+            question (str): Request content to match against the knowledge base
+
+        Returns:
+            tuple: (sources, matches), where matches is the raised exception if retrieval failed
+        """
+        try:
+            return sources, await self._guarded(self.rag.retrieve_similar(question, self.threshold))
+        except Exception as e:
+            return sources, e
+
     async def make_replies(self) -> bool:
         """
         Generate structured replies to all pending requests using RAG retrieval.
@@ -68,6 +91,10 @@ class RAGRegion(BaseRegion):
         Note:
             - Processes each pending request from _incoming_requests
             - Retrieves relevant knowledge fragments using RAG system
+            - Retrievals for all pending requests run concurrently, bounded by max_inflight
+            - Identical questions from several sources are retrieved once
+            - Each reply is sent as soon as its retrieval completes, so replies may be
+              sent in a different order than the requests arrived
             - Constructs replies as JSON-formatted memory fragments
             - Includes actor metadata if reply_with_actors=True
             - Sends replies via _reply() method
@@ -80,33 +107,39 @@ class RAGRegion(BaseRegion):
         faultless = True
         self._run_inbox()
 
-        if self._incoming_requests.empty():
+        if not self._incoming_requests:
             logging.info(f"{self.name}: No incoming requests to process.")
             return True
-        while not self._incoming_requests.empty():
-            request = self._incoming_requests.get_nowait()
-            source, question = request.popitem()
-
-            matches = None
-            reply = ''
-            try:
-                matches = await self.rag.retrieve_similar(question, self.threshold)
-            except Exception as e:
-                logging.warning(f"{self.name}: Processing failed. {e.args}")
+        # Take the pending requests in one step so nothing queued during the awaits below is mixed in
+        requests, self._incoming_requests = self._incoming_requests, deque()
+        pending = {}
+        for source, question in requests:
+            # Sources asking the same question share a single retrieval
+            pending.setdefault(question, []).append(source)
+
+        # Retrievals are independent; reply to each as soon as its retrieval finishes
+        retrievals = [self._retrieve_for(sources, question) for question, sources in pending.items()]
+        for retrieval in asyncio.as_completed(retrievals):
+            sources, matches = await retrieval
+            if isinstance(matches, Exception):
+                logging.warning("%s: Processing failed. %s", self.name, matches.args)
                 faultless = False
+                matches = None
             if matches:
+                fragments = []
                 for match in matches:
-                    # CORRECTED: Dictionary key access with proper JSON formatting
-                    reply += '{"memory_fragment": "' + match.chunk.content + '"'
+                    fragment = {"memory_fragment": match.chunk.content}
                     if self.reply_with_actors:
-                        actors = match.chunk.metadata.actors
-                        reply += ', "actors": ' + json.dumps(actors)
-                    reply += '},\n'
+                        fragment["actors"] = match.chunk.metadata.actors
+                    fragments.append(fragment)
+                # One JSON object per line, each followed by a comma
+                reply = ''.join(json.dumps(fragment) + ',\n' for fragment in fragments)
                 if reply:
-                    self._reply(source, reply)
-                    self.connections.update({source: 'Previously replied to'})
+                    for source in sources:
+                        self._reply(source, reply)
+                        self.connections.update({source: 'Previously replied to'})
             else:
-                logging.info(f"{self.name}: No matches found.")
+                logging.info("%s: No matches found.", self.name)
 
         return faultless
 
@@ -135,47 +168,49 @@ class RAGRegion(BaseRegion):
             return False
         faultless = True
         self._run_inbox()
-        results: list[RetrievalResult] = []
 
-        if self._incoming_replies.empty():
+        if not self._incoming_replies:
             logging.info(f"{self.name}: No incoming replies to process.")
             return True
 
-        while not self._incoming_replies.empty():
-            request = self._incoming_replies.get_nowait()
-            source, update = request.popitem()
+        # Take the pending updates in one step; replies arriving during the awaits below stay queued
+        updates, self._incoming_replies = self._incoming_replies, deque()
+        for source, update in updates:
             updated = False
             hashes_to_delete = []
+            results: list[RetrievalResult] = []
 
             try:
-                results = await self.rag.retrieve_similar(update)
+                results = await self._guarded(self.rag.retrieve_similar(update))
             except Exception as e:
-                logging.warning(f"{self.name}: Processing failed. {e.args}")
+                logging.warning("%s: Processing failed. %s", self.name, e.args)
                 faultless = False
 
             if results:
-                max_score = max(result.similarity_score for result in results)
-
-                for result in results:
-                    if result.similarity_score == max_score and not updated:
-                        updated = await self.rag.update_chunk(
-                            result.chunk.chunk_hash,
-                            update,
-                            result.chunk.metadata.actors
-                        )
-                    if result.similarity_score > max_score-consolidate_threshold:
-                        hashes_to_delete.append(result.chunk.chunk_hash)
+                # retrieve_similar returns results sorted by similarity, highest first
+                best = results[0]
+                updated = await self._guarded(self.rag.update_chunk(
+                    best.chunk.chunk_hash,
+                    update,
+                    best.chunk.metadata.actors
+                ))
+                cutoff = best.similarity_score - consolidate_threshold
+                hashes_to_delete = [
+                    result.chunk.chunk_hash
+                    for result in takewhile(lambda result, cutoff=cutoff: result.similarity_score > cutoff, results)
+                ]
                 if hashes_to_delete:
-                    for chunk_hash in hashes_to_delete:
-                        success = await self.rag.delete_chunk(chunk_hash)
-                        faultless = faultless and success
+                    deleted = await asyncio.gather(
+                        *(self._guarded(self.rag.delete_chunk(chunk_hash)) for chunk_hash in hashes_to_delete)
+                    )
+                    faultless = faultless and all(deleted)
             else:
-                logging.info(f"{self.name}: Processing failed - no results found.")
+                logging.info("%s: Processing failed - no results found.", self.name)
                 faultless = False
             if updated:
-                logging.info(f"{self.name}: Database update from {source} succeeded.")
+                logging.info("%s: Database update from %s succeeded.", self.name, source)
             if hashes_to_delete:
-                logging.info(f"{self.name}: Consolidated {len(hashes_to_delete)+1} chunks.")
+                logging.info("%s: Consolidated %d chunks.", self.name, len(hashes_to_delete) + 1)
 
         return faultless
 
@@ -187,12 +222,11 @@ class RAGRegion(BaseRegion):
             ValueError: If no valid connections exist
 
         Note:
-            - Sends a standardized "Summarize the knowledge you have" request
+            - Sends the standardized SUMMARY_REQUEST text
             - Targets all regions in connections dictionary
-            - Uses _ask() method for non-blocking communication
+            - Uses _ask_many() so every recipient gets byte-identical request text
             - Should be called periodically to refresh knowledge
         """
         if not self.connections:
             raise ValueError(f"{self.name}: No valid connections for summarization.")
-        for connection in self.connections:
-            self._ask(connection, "Summarize the knowledge you have.")
+        self._ask_many(self.connections, SUMMARY_REQUEST)
@@ -1,10 +1,14 @@
+import asyncio
 import json
 import logging
 import re
+from collections import deque
+
+import aiohttp
 
 from regions.base_region import BaseRegion
 from modules.llmlink import LLMLink
-from modules.utils import make_prompt
+from modules.utils import compact_json, make_prompt
 
 
 class Region(BaseRegion):
@@ -22,11 +26,11 @@ class Region(BaseRegion):
         connections (dict[str, str]): Mapping of downstream region names to their task descriptions
         inbox (asyncio.Queue): Queue for incoming messages (requests and replies)
         outbox (asyncio.Queue): Queue for outgoing messages (requests and replies)
-        _incoming_replies (dict): Stores knowledge received from other regions (keyed by source region name)
-        _incoming_requests (dict): Stores pending requests received from other regions (keyed by source region name)
+        _incoming_replies (deque): Knowledge received from other regions, as (source, content) tuples
+        _incoming_requests (deque): Pending requests received from other regions, as (source, content) tuples
     """
 
-    def __init__(self, name: str, task: str, llm: LLMLink, connections: dict[str, str] | None):
+    def __init__(self, name: str, task: str, llm: LLMLink, connections: dict[str, str] | None, max_inflight: int = 8):
         """
         Initialize a region with communication capabilities and LLM integration.
 
@@ -36,26 +40,32 @@ class Region(BaseRegion):
             llm (LLMLink): Interface to the LLM service for text generation
             connections (dict[str, str] | None): Mapping of region names to their task descriptions.
                 If None, initializes with empty connections dictionary.
+            max_inflight (int, optional): Maximum number of concurrent LLM calls. Defaults to 8.
 
         Note:
             - The region maintains separate queues for incoming/outgoing messages
             - Connections dictionary should contain {region_name: task_description} pairs
             - _context and _queries dictionaries are initialized empty for knowledge management
         """
-        super().__init__(name, task, connections)
+        super().__init__(name, task, connections, max_inflight)
         self.llm = llm
         self.focus_str = f"Your focus: {self.task}"
 
     def _replies_block(self) -> str:
         """
-        Writes incoming replies block by peeking at the incoming replies queue.
+        Writes incoming replies block from the incoming replies, leaving them in place.
+        Replies whose content repeats an earlier reply (e.g. forwarded summaries) are left out.
         :return: (str): A prefixed JSON dump of incoming replies
         """
-        if not self._incoming_replies.empty():
-            raw_incoming_replies = [*self._incoming_replies.__dict__['_queue']]
-        else:
+        if not self._incoming_replies:
             return ''
-        schema_str = json.dumps(raw_incoming_replies, indent=2)
+        seen = set()
+        knowledge = []
+        for source, content in self._incoming_replies:
+            if content not in seen:
+                seen.add(content)
+                knowledge.append({source: content})
+        schema_str = compact_json(knowledge)
         block = f"Below is a summary of your knowledge from different sources:\n{schema_str}\n"
         return block
 
@@ -64,16 +74,21 @@ class Region(BaseRegion):
         Writes incoming requests block by peeking at the incoming requests queue.
         :return: (str): A prefixed JSON dump of incoming requests
         """
-        if not self._incoming_requests.empty():
-            raw_incoming_requests = [*self._incoming_requests.__dict__['_queue']]
-        else:
+        if not self._incoming_requests:
             return ''
-        schema_str = json.dumps(raw_incoming_requests, indent=2)
+        schema_str = compact_json([{source: question} for source, question in self._incoming_requests])
         prefix = ("Below is a list of current incoming requests, "
                   "which may contain useful information:")
         block = f"{prefix}\n{schema_str}\n"
         return block
 
+    def _background(self) -> str:
+        """
+        Writes the system background shared by prompts built from the current queue state.
+        :return: (str): Focus string followed by the replies and requests blocks
+        """
+        return '\n'.join([self.focus_str, self._replies_block(), self._requests_block()])
+
     async def _parse_thinking(self, raw_reply: str) -> str:
         """
             Extracts the thinking block from raw LLM replies using delimiter patterns.
@@ -95,15 +110,16 @@ class Region(BaseRegion):
                 - Logs debug messages about extraction status
                 - Returns stripped content to remove extraneous whitespace
         """
-        # Parse out model thinking
+        # Parse out model thinking, splitting on the last closing delimiter
         # If there is no thinking block, pass the raw reply
-        try:
-            reply = re.findall(r"<think>.*</think>\n(.*)", raw_reply, flags=re.DOTALL)[0].strip()
+        head, sep, tail = raw_reply.rpartition("</think>\n")
+        if sep and "<think>" in head:
+            reply = tail.strip()
             logging.debug("Thinking block found in raw reply.")
-        except IndexError:
+        else:
             reply = raw_reply.strip()
 
-        logging.debug(f"{self.name}: Extracted reply: {str(reply)}")
+        logging.debug("%s: Extracted reply: %s", self.name, reply)
         return reply
 
     async def _get_from_llm(self, prompt: str) -> str:
@@ -124,6 +140,7 @@ class Region(BaseRegion):
 
         Note:
             - Logs raw LLM responses at debug level
+            - LLM calls are gated by the region's concurrency semaphore
             - Catches exceptions during LLM processing and logs warnings
             - Returns empty string on failure but preserves raw output in logs
             - Always returns a string (never raises exceptions)
@@ -131,8 +148,8 @@ class Region(BaseRegion):
         raw_reply = ""
         reply = ""
         try:
-            raw_reply = await self.llm.text(prompt)
-            logging.debug(f"{self.name}: Got reply from LLM: {raw_reply}")
+            raw_reply = await self._guarded(self.llm.text(prompt))
+            logging.debug("%s: Got reply from LLM: %s", self.name, raw_reply)
             reply = await self._parse_thinking(raw_reply)
 
         except Exception as e:
@@ -142,6 +159,40 @@ class Region(BaseRegion):
 
         return reply
 
+    async def _get_batch_from_llm(self, prompts: list[str]) -> list[str]:
+        """
+        Sends several prompts to the LLM and processes each raw response through thinking extraction.
+
+        Multiple prompts are submitted in one batched request via self.llm.text_batch(). If the
+        backend does not support batching (the response has the wrong shape, raising ValueError or
+        KeyError) or the request fails in transport (HTTP or connection error, timeout), each prompt
+        is sent individually (concurrently) via _get_from_llm(). Those calls run in parallel under
+        the LLM client's own timeout, so the fallback adds at most one request timeout, and a prompt
+        only fails if its own call fails too.
+        Duplicate prompts within the call are sent once and share the reply.
+
+        Args:
+            prompts (list[str]): Formatted prompt strings ready for LLM processing
+
+        Returns:
+            list[str]: Processed reply for each prompt, in order; empty strings mark failures
+        """
+        # Identical prompts (same question, same background) are only generated once
+        unique = list(dict.fromkeys(prompts))
+
+        replies = {}
+        if len(unique) > 1:
+            try:
+                raw_replies = await self._guarded(self.llm.text_batch(unique))
+                logging.debug("%s: Got %d batched replies from LLM", self.name, len(raw_replies))
+                replies = {prompt: await self._parse_thinking(raw_reply) for prompt, raw_reply in zip(unique, raw_replies)}
+            except (ValueError, KeyError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logging.warning(f"{self.name}: Batched LLM call failed, sending prompts individually. {e!r}")
+        if not replies:
+            replies = dict(zip(unique, await asyncio.gather(*(self._get_from_llm(prompt) for prompt in unique))))
+
+        return [replies[prompt] for prompt in prompts]
+
     def _make_replies_init(self) -> tuple:
         """
         Internal function to set initial variables for make_replies(). Raises
@@ -149,10 +200,10 @@ class Region(BaseRegion):
         :return:
         tuple: initial settings for 'faultless' (True) and 'success' (empty list) variables
         """
-        logging.debug(f"{self.name}: Initiating reply generation...")
         self._run_inbox()
-        if self._incoming_requests.empty():
+        if not self._incoming_requests:
             raise ValueError
+        logging.debug(f"{self.name}: Initiating reply generation...")
         return True, []
 
 
@@ -166,6 +217,8 @@ class Region(BaseRegion):
         Note:
             - Processes each pending request from _incoming_requests
             - Generates replies using LLM with region-specific context
+            - The background is built once per batch, so all prompts share the same prefix
+            - Pending requests are sent to the LLM as one batch, falling back to concurrent calls
             - Sends replies via _reply() method
             - Returns False if any LLM processing fails
             - Clears _incoming_requests after processing
@@ -176,18 +229,17 @@ class Region(BaseRegion):
             logging.info(f"{self.name}: No incoming requests to process.")
             return True
 
-        initial_length = self._incoming_requests.qsize()
-        while not self._incoming_requests.empty():
-            request = self._incoming_requests.get_nowait()
-            source, question = request.popitem()
+        initial_length = len(self._incoming_requests)
+        # Build the background once so every prompt in the batch shares an identical prefix
+        background = self._background()
+        requests, self._incoming_requests = self._incoming_requests, deque()
+        pending = []
+        for source, question in requests:
+            pending.append((source, make_prompt(question, background)))
 
-            prompt = make_prompt(
-                question,
-                '\n'.join([self.focus_str, self._replies_block(), self._requests_block()])
-            )
-
-            reply = await self._get_from_llm(prompt)
+        replies = await self._get_batch_from_llm([prompt for _, prompt in pending])
 
+        for (source, _), reply in zip(pending, replies):
             if reply:
                 self._reply(source, reply)
                 success.append(True)
@@ -220,16 +272,13 @@ class Region(BaseRegion):
         user_prompt = (
                 "Below is a dictionary of sources and their respective focus. Keeping your own "
                 "focus in mind, ask each of them one or more questions to update your knowledge."
-                "\n\n" + json.dumps(self.connections, indent=2) +
+                "\n\n" + compact_json(self.connections) +
                 '\n\nReply with your questions in valid JSON format according to the template:\n'
                 '[{"source": source1, "question": question1}, {"source": source2, '
                 '"question": question2}, ... ]'
         )
 
-        prompt = make_prompt(
-            user_prompt,
-            '\n'.join([self.focus_str, self._replies_block(), self._requests_block()])
-        )
+        prompt = make_prompt(user_prompt, self._background())
         reply = await self._get_from_llm(prompt)
 
         if not reply:
@@ -283,18 +332,16 @@ class Region(BaseRegion):
         """
         faultless = True
         self._run_inbox()
-        original_length = self._incoming_replies.qsize()
-        if self._incoming_replies.empty():
+        original_length = len(self._incoming_replies)
+        if not self._incoming_replies:
             logging.info(f"{self.name}: No replies to summarize.")
             return True
         self._consolidate_replies()
         replies = {}
         prompt = 'Summarize the following into a single coherent paragraph without losing information:\n\n'
-        if not self._incoming_replies.empty():
-            while not self._incoming_replies.empty():
-                item = self._incoming_replies.get_nowait()
-                source = next(iter(item.keys()))
-                content = item[source]
+        if self._incoming_replies:
+            while self._incoming_replies:
+                source, content = self._incoming_replies.popleft()
                 prompt += content
                 try:
                     reply = await self._get_from_llm(make_prompt(prompt))
@@ -306,9 +353,9 @@ class Region(BaseRegion):
                     faultless = False
                 replies.update({source: reply})
             for source in replies:
-                self._incoming_replies.put_nowait({source: replies[source]})
+                self._incoming_replies.append((source, replies[source]))
             logging.info(
-                f"{self.name}: Summarized {original_length} replies to a total of {self._incoming_replies.qsize()} items.")
+                f"{self.name}: Summarized {original_length} replies to a total of {len(self._incoming_replies)} items.")
             return faultless
         raise AssertionError(
             "Incoming reply queue empty after consolidation, but it should not be. Please bring this to the attention of the developer and proceed with caution.")
@@ -2,9 +2,11 @@
 Utility functions for the Regions package
 """
 import asyncio
+import json
 import logging
 import re
 from asyncio import Queue
+from collections import deque
 from typing import List
 
 import coloredlogs
@@ -173,6 +175,16 @@ async def until_empty(queue: Queue, interval: float = 0.1, timeout: float = 3) -
     logging.warning("Queue  not empty after timeout")
     return False
 
+def drain_queue(queue: Queue) -> deque:
+    """
+    Remove and return every item currently in an asyncio queue.
+    Items are taken through get_nowait(), so the queue's own bookkeeping stays consistent.
+    :param queue: (Queue) Queue to drain
+    :return: (deque) Drained items in FIFO order
+    """
+    return deque(queue.get_nowait() for _ in range(queue.qsize()))
+
+
 def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
     """Calculate cosine similarity between two vectors.
 
@@ -248,3 +260,11 @@ def make_prompt(question: str, background: str = '', bom: str = '<|im_start|>',
     prompt = f"{prefix}{background}{eom}\n{bom}user\n{question}{eom}\n{bom}assistant\n"
     return prompt
 
+
+def compact_json(obj) -> str:
+    """
+    Serialize an object to JSON without insignificant whitespace, for embedding in prompts.
+    :param obj: JSON-serializable object
+    :return: (str) Compact JSON string with non-ASCII characters left as-is
+    """
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
@@ -155,13 +155,7 @@ def verify(
     for region in registry.regions:
 
         # Ensure there's a non-empty region type
-        registry_type = None
-
-        try:
-            registry_index = registry.names.index(region.name)
-            registry_type = registry.regions[registry_index].type
-        except ValueError:
-            logging.warning(f"'{region}' not found in RegionRegistry")
+        registry_type = region.type
 
         if registry_type:
             determined_type = registry_type
@@ -18,48 +18,48 @@ class TestBaseRegion:
 
     async def test_keep_last_reply_per_source(self, region, caplog):
         # Add replies to the queue
-        region._incoming_replies.put_nowait({"source1": "reply1"})
-        region._incoming_replies.put_nowait({"source1": "reply2"})
-        region._incoming_replies.put_nowait({"source2": "reply3"})
+        region._incoming_replies.append(("source1", "reply1"))
+        region._incoming_replies.append(("source1", "reply2"))
+        region._incoming_replies.append(("source2", "reply3"))
 
         # Test the method
         region.keep_last_reply_per_source()
 
         # Verify only the last reply per source remains
-        assert region._incoming_replies.qsize() == 2
-        assert region._incoming_replies.get_nowait() == {"source1": "reply2"}
-        assert region._incoming_replies.get_nowait() == {"source2": "reply3"}
+        assert len(region._incoming_replies) == 2
+        assert region._incoming_replies.popleft() == ("source1", "reply2")
+        assert region._incoming_replies.popleft() == ("source2", "reply3")
 
         # Verify logs
         assert "Pruned 1 replies" in caplog.text
 
     async def test_consolidate_replies(self, region, caplog):
         # Add multiple replies from same source
-        region._incoming_replies.put_nowait({"source1": "reply1"})
-        region._incoming_replies.put_nowait({"source1": "reply2"})
-        region._incoming_replies.put_nowait({"source2": "reply3"})
+        region._incoming_replies.append(("source1", "reply1"))
+        region._incoming_replies.append(("source1", "reply2"))
+        region._incoming_replies.append(("source2", "reply3"))
 
         # Test the method
         region._consolidate_replies()
 
         # Verify consolidated replies
-        assert region._incoming_replies.qsize() == 2
-        assert region._incoming_replies.get_nowait() == {"source1": "reply1\nreply2"}
-        assert region._incoming_replies.get_nowait() == {"source2": "reply3"}
+        assert len(region._incoming_replies) == 2
+        assert region._incoming_replies.popleft() == ("source1", "reply1\nreply2")
+        assert region._incoming_replies.popleft() == ("source2", "reply3")
 
         # Verify logs
         assert "Consolidated 3 replies" in caplog.text
 
     async def test_clear_replies(self, region, caplog):
         # Add replies to the queue
-        region._incoming_replies.put_nowait({"source1": "reply1"})
-        region._incoming_replies.put_nowait({"source2": "reply2"})
+        region._incoming_replies.append(("source1", "reply1"))
+        region._incoming_replies.append(("source2", "reply2"))
 
         # Test the method
         region.clear_replies()
 
         # Verify queue is empty
-        assert region._incoming_replies.empty()
+        assert not region._incoming_replies
 
         # Verify logs
         assert "All replies cleared" in caplog.text
@@ -81,30 +81,73 @@ class TestBaseRegion:
 
     async def test_keep_last_with_different_sources(self, region, caplog):
         # Add replies from multiple sources
-        region._incoming_replies.put_nowait({"source1": "reply1"})
-        region._incoming_replies.put_nowait({"source2": "reply2"})
-        region._incoming_replies.put_nowait({"source1": "reply3"})
-        region._incoming_replies.put_nowait({"source2": "reply4"})
+        region._incoming_replies.append(("source1", "reply1"))
+        region._incoming_replies.append(("source2", "reply2"))
+        region._incoming_replies.append(("source1", "reply3"))
+        region._incoming_replies.append(("source2", "reply4"))
 
         # Test the method
         region.keep_last_reply_per_source()
 
         # Verify only the last reply per source remains
-        assert region._incoming_replies.qsize() == 2
-        assert region._incoming_replies.get_nowait() == {"source1": "reply3"}
-        assert region._incoming_replies.get_nowait() == {"source2": "reply4"}
+        assert len(region._incoming_replies) == 2
+        assert region._incoming_replies.popleft() == ("source1", "reply3")
+        assert region._incoming_replies.popleft() == ("source2", "reply4")
 
     async def test_consolidate_multiple_sources(self, region, caplog):
         # Add replies from same source
-        region._incoming_replies.put_nowait({"source1": "reply1"})
-        region._incoming_replies.put_nowait({"source1": "reply2"})
-        region._incoming_replies.put_nowait({"source1": "reply3"})
-        region._incoming_replies.put_nowait({"source2": "reply4"})
+        region._incoming_replies.append(("source1", "reply1"))
+        region._incoming_replies.append(("source1", "reply2"))
+        region._incoming_replies.append(("source1", "reply3"))
+        region._incoming_replies.append(("source2", "reply4"))
 
         # Test the method
         region._consolidate_replies()
 
         # Verify consolidated replies
-        assert region._incoming_replies.qsize() == 2
-        assert region._incoming_replies.get_nowait() == {"source1": "reply1\nreply2\nreply3"}
-        assert region._incoming_replies.get_nowait() == {"source2": "reply4"}
\ No newline at end of file
+        assert len(region._incoming_replies) == 2
+        assert region._incoming_replies.popleft() == ("source1", "reply1\nreply2\nreply3")
+        assert region._incoming_replies.popleft() == ("source2", "reply4")
+    async def test_run_inbox_sorts_messages(self, region):
+        # Mix requests and replies in the inbox
+        region.inbox.put_nowait({"source": "a", "destination": "test_region", "content": "q1", "role": "request"})
+        region.inbox.put_nowait({"source": "b", "destination": "test_region", "content": "r1", "role": "reply"})
+        region.inbox.put_nowait({"source": "c", "destination": "test_region", "content": "q2", "role": "request"})
+
+        region._run_inbox()
+
+        # Verify the inbox is drained and messages are routed in order
+        assert region.inbox.empty()
+        assert region._incoming_requests.popleft() == ("a", "q1")
+        assert region._incoming_requests.popleft() == ("c", "q2")
+        assert region._incoming_replies.popleft() == ("b", "r1")
+
+    async def test_run_inbox_unknown_role(self, region):
+        region.inbox.put_nowait({"source": "a", "destination": "test_region", "content": "?", "role": "gossip"})
+
+        with pytest.raises(AssertionError, match="Unknown message role: gossip"):
+            region._run_inbox()
+
+    async def test_run_inbox_unknown_role_keeps_later_messages(self, region):
+        later = {"source": "c", "destination": "test_region", "content": "q2", "role": "request"}
+        region.inbox.put_nowait({"source": "a", "destination": "test_region", "content": "q1", "role": "request"})
+        region.inbox.put_nowait({"source": "b", "destination": "test_region", "content": "?", "role": "gossip"})
+        region.inbox.put_nowait(later)
+
+        with pytest.raises(AssertionError, match="Unknown message role: gossip"):
+            region._run_inbox()
+
+        # Messages before the bad one are stored; the one after it is still queued
+        assert region._incoming_requests.popleft() == ("a", "q1")
+        assert region.inbox.get_nowait() == later
+        assert region.inbox.empty()
+
+    async def test_ask_many(self, region):
+        region._ask_many(["a", "b"], "shared question")
+
+        # Verify one independent request per destination with identical content
+        first = region.outbox.get_nowait()
+        second = region.outbox.get_nowait()
+        assert first == {"source": "test_region", "destination": "a", "content": "shared question", "role": "request"}
+        assert second == {"source": "test_region", "destination": "b", "content": "shared question", "role": "request"}
+        assert first is not second
@@ -0,0 +1,64 @@
+import pytest
+
+from regions.broadcast_region import BroadcastRegion
+
+
+@pytest.fixture
+def region():
+    return BroadcastRegion("hub", connections={"foo": "does things", "bar": "does stuff"})
+
+
+def test_broadcast_copies_to_all_connections(region):
+    region.inbox.put_nowait({"source": "a", "destination": "hub", "content": "q1", "role": "request"})
+    region.inbox.put_nowait({"source": "b", "destination": "hub", "content": "r1", "role": "reply"})
+
+    region.broadcast()
+
+    assert region.inbox.empty()
+    sent = [region.outbox.get_nowait() for _ in range(region.outbox.qsize())]
+    assert sent == [
+        {"source": "a", "destination": "foo", "content": "q1", "role": "request"},
+        {"source": "a", "destination": "bar", "content": "q1", "role": "request"},
+        {"source": "b", "destination": "foo", "content": "r1", "role": "reply"},
+        {"source": "b", "destination": "bar", "content": "r1", "role": "reply"},
+    ]
+
+
+def test_broadcast_empty_inbox(region):
+    region.broadcast()
+    assert region.outbox.empty()
+
+
+def test_broadcast_unknown_role(region):
+    region.inbox.put_nowait({"source": "a", "destination": "hub", "content": "x", "role": "gossip"})
+    with pytest.raises(AssertionError):
+        region.broadcast()
+
+
+def test_broadcast_unknown_role_keeps_later_messages(region, caplog):
+    later = {"source": "c", "destination": "hub", "content": "q2", "role": "request"}
+    region.inbox.put_nowait({"source": "a", "destination": "hub", "content": "q1", "role": "request"})
+    region.inbox.put_nowait({"source": "b", "destination": "hub", "content": "x", "role": "gossip"})
+    region.inbox.put_nowait(later)
+
+    with caplog.at_level("INFO"), pytest.raises(AssertionError):
+        region.broadcast()
+
+    # The message before the bad one was forwarded and counted; the one after it is still queued
+    assert region.outbox.qsize() == 2
+    assert region.inbox.get_nowait() == later
+    assert region.inbox.empty()
+    assert "hub: Broadcast 1 requests, 0 replies to 2 recipients" in [record.getMessage() for record in caplog.records]
+
+
+def test_broadcast_logs_single_summary(region, caplog):
+    for i in range(3):
+        region.inbox.put_nowait({"source": "a", "destination": "hub", "content": f"q{i}", "role": "request"})
+    region.inbox.put_nowait({"source": "b", "destination": "hub", "content": "r1", "role": "reply"})
+
+    with caplog.at_level("INFO"):
+        region.broadcast()
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "hub: Broadcast 3 requests, 1 replies to 2 recipients"
+    ]
@@ -55,3 +55,24 @@ async def test_database_operations(db_manager):
     
     # Verify deletion
     assert len(await db_manager.get_all_chunks()) == 0
+
+
+@pytest.mark.asyncio
+async def test_store_chunk_rate_limited(db_manager):
+    """Test that successive chunk writes are spaced by the rate limiter's minimum interval"""
+    chunks = [
+        DocumentChunk(
+            content=f"Rate limited chunk {i}",
+            metadata=ChunkMetadata(timestamp=int(time.time()), actors=["system"]),
+            embedding=[0.1, 0.2, 0.3]
+        )
+        for i in range(3)
+    ]
+
+    start = time.time()
+    for chunk in chunks:
+        assert await db_manager.store_chunk(chunk)
+    elapsed = time.time() - start
+
+    # The first write may go straight through; each later one waits out the interval
+    assert elapsed >= 2 * db_manager.rate_limiter.min_interval * 0.95
@@ -81,7 +81,7 @@ async def test_execute_layer_chain_failure(caplog, test_registry):
             await asyncio.sleep(0.1)
             raise RuntimeError("Test failure")
 
-    region_dictionary.append({"name": "FailingRegion", "class": FailingRegion})
+    register_region_type("FailingRegion", FailingRegion)
 
     # Setup regions with failing method
     region2 = FailingRegion('region2')
@@ -153,7 +153,7 @@ async def test_execute_plan_layer_failure(caplog, test_registry):
         async def mock_method(self):
             raise RuntimeError("Layer failure")
 
-    region_dictionary.append({"name": "FailingRegion", "class": FailingRegion})
+    register_region_type("FailingRegion", FailingRegion)
 
     region1 = FailingRegion('region1')
     registry = test_registry
@@ -61,6 +61,8 @@ class TestListenerRegion(unittest.IsolatedAsyncioTestCase):
             self.region._post("dest", "content", "role")
         with self.assertRaises(NotImplementedError):
             self.region._ask("dest", "query")
+        with self.assertRaises(NotImplementedError):
+            self.region._ask_many(["dest"], "query")
         with self.assertRaises(NotImplementedError):
             self.region._reply("dest", "reply")
         with self.assertRaises(NotImplementedError):
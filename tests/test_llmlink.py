@@ -30,6 +30,15 @@ class TestLLMLink(unittest.IsolatedAsyncioTestCase):
         print(f"=== MODEL OUTPUT ===\n{result}\n=== END MODEL OUTPUT ===\n")
         assert isinstance(result, str)
 
+    async def test_text_batch(self):
+        test_strings = ['Twinkle, Twinkle little ', 'Roses are red, violets are ']
+        max_tokens = 32
+        result = await self.obj.text_batch(test_strings, max_tokens)
+        print(f"=== MODEL OUTPUT ===\n{result}\n=== END MODEL OUTPUT ===\n")
+        assert isinstance(result, list)
+        assert len(result) == len(test_strings)
+        assert all(isinstance(item, str) for item in result)
+
     async def test_model(self):
         result = await self.obj.model()
         print("\n"+result+"\n")
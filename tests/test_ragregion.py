@@ -1,6 +1,8 @@
 import asyncio
+import json
 import unittest
 import time
+from collections import deque
 from unittest.mock import AsyncMock, patch
 
 from regions.rag_region import RAGRegion
@@ -36,8 +38,8 @@ class TestRAGRegion(unittest.TestCase):
         self.assertEqual(self.region.connections, {"other_region": "other knowledge task"})
         self.assertIsInstance(self.region.inbox, asyncio.Queue)
         self.assertIsInstance(self.region.outbox, asyncio.Queue)
-        self.assertIsInstance(self.region._incoming_replies, asyncio.Queue)
-        self.assertIsInstance(self.region._incoming_requests, asyncio.Queue)
+        self.assertIsInstance(self.region._incoming_replies, deque)
+        self.assertIsInstance(self.region._incoming_requests, deque)
         self.assertTrue(self.region.reply_with_actors)
 
         # Test initialization without reply_with_actors
@@ -90,8 +92,8 @@ class TestRAGRegion(unittest.TestCase):
 
         self.region._run_inbox()
 
-        self.assertEqual([*self.region._incoming_replies.__dict__['_queue']], [{"other_region": "knowledge update"}])
-        self.assertEqual([*self.region._incoming_requests.__dict__['_queue']], [{"other_region": "question"}])
+        self.assertEqual([*self.region._incoming_replies], [("other_region", "knowledge update")])
+        self.assertEqual([*self.region._incoming_requests], [("other_region", "question")])
 
     async def test_make_replies_success(self):
         """Test successful reply generation with matching fragments"""
@@ -121,7 +123,7 @@ class TestRAGRegion(unittest.TestCase):
         result = await self.region.make_replies()
 
         self.assertTrue(result)
-        self.assertTrue(self.region._incoming_requests.empty())
+        self.assertFalse(self.region._incoming_requests)
 
         # Verify reply was sent
         message = await self.region.outbox.get()
@@ -152,7 +154,7 @@ class TestRAGRegion(unittest.TestCase):
         result = await self.region.make_replies()
 
         self.assertTrue(result)  # Should still return True even with empty reply
-        self.assertTrue(self.region._incoming_requests.empty())
+        self.assertFalse(self.region._incoming_requests)
 
         # Check if outbox is empty (no reply was sent)
         self.assertTrue(self.region.outbox.empty(), "Expected no reply to be sent when no matches exist")
@@ -174,7 +176,7 @@ class TestRAGRegion(unittest.TestCase):
         result = await self.region.make_replies()
 
         self.assertFalse(result)
-        self.assertTrue(self.region._incoming_requests.empty())  # Queries still cleared
+        self.assertFalse(self.region._incoming_requests)  # Queries still cleared
 
     async def test_make_replies_without_actors(self):
         """Test reply format when reply_with_actors=False"""
@@ -214,6 +216,75 @@ class TestRAGRegion(unittest.TestCase):
         expected_reply = '{"memory_fragment": "The Roman Empire fell in 476 AD"},\n'
         self.assertEqual(message["content"], expected_reply)
 
+    async def test_make_replies_escapes_content(self):
+        """Test that fragment content with quotes and newlines yields valid JSON"""
+        await self.region.inbox.put({
+            "source": "other_region",
+            "role": "request",
+            "content": "What did the historian say?"
+        })
+        self.region._run_inbox()
+
+        mock_chunk = DocumentChunk(
+            content='He said "Rome fell"\nin 476 AD',
+            metadata=ChunkMetadata(actors=["historian"], timestamp=int(time.time()))
+        )
+        self.mock_rag.retrieve_similar.return_value = [
+            RetrievalResult(chunk=mock_chunk, similarity_score=0.9)
+        ]
+
+        await self.region.make_replies()
+
+        message = await self.region.outbox.get()
+        fragments = json.loads('[' + message["content"].rstrip(',\n') + ']')
+        self.assertEqual(fragments, [{"memory_fragment": 'He said "Rome fell"\nin 476 AD', "actors": ["historian"]}])
+
+    async def test_make_replies_posts_in_completion_order(self):
+        """Test that a fast retrieval is replied to before a slow one finishes"""
+        fast_chunk = DocumentChunk(
+            content="Fast fact",
+            metadata=ChunkMetadata(actors=["historian"], timestamp=int(time.time()))
+        )
+        slow_chunk = DocumentChunk(
+            content="Slow fact",
+            metadata=ChunkMetadata(actors=["historian"], timestamp=int(time.time()))
+        )
+
+        async def retrieve(question, threshold):
+            if question == "slow":
+                await asyncio.sleep(0.05)
+                return [RetrievalResult(chunk=slow_chunk, similarity_score=0.9)]
+            return [RetrievalResult(chunk=fast_chunk, similarity_score=0.9)]
+
+        self.mock_rag.retrieve_similar.side_effect = retrieve
+        await self.region.inbox.put({"source": "slow_region", "role": "request", "content": "slow"})
+        await self.region.inbox.put({"source": "fast_region", "role": "request", "content": "fast"})
+
+        result = await self.region.make_replies()
+
+        self.assertTrue(result)
+        first = self.region.outbox.get_nowait()
+        second = self.region.outbox.get_nowait()
+        self.assertEqual(first["destination"], "fast_region")
+        self.assertEqual(second["destination"], "slow_region")
+
+    async def test_make_replies_deduplicates_questions(self):
+        """Test that identical questions from different sources share one retrieval"""
+        mock_chunk = DocumentChunk(
+            content="Shared fact",
+            metadata=ChunkMetadata(actors=["historian"], timestamp=int(time.time()))
+        )
+        self.mock_rag.retrieve_similar.return_value = [RetrievalResult(chunk=mock_chunk, similarity_score=0.9)]
+        for source in ("region_a", "region_b"):
+            await self.region.inbox.put({"source": source, "role": "request", "content": "Summarize the knowledge you have."})
+
+        result = await self.region.make_replies()
+
+        self.assertTrue(result)
+        self.assertEqual(self.mock_rag.retrieve_similar.await_count, 1)
+        destinations = {self.region.outbox.get_nowait()["destination"] for _ in range(2)}
+        self.assertEqual(destinations, {"region_a", "region_b"})
+
     async def test_make_updates_success(self):
         """Test successful knowledge update and consolidation"""
         # Setup incoming knowledge update
@@ -251,7 +322,7 @@ class TestRAGRegion(unittest.TestCase):
         result = await self.region.make_updates(consolidate_threshold=0.2)
 
         self.assertTrue(result)
-        self.assertTrue(self.region._incoming_replies.empty())
+        self.assertFalse(self.region._incoming_replies)
 
         # Verify update_chunk was called with highest similarity
         self.mock_rag.update_chunk.assert_called_once_with(
@@ -263,6 +334,46 @@ class TestRAGRegion(unittest.TestCase):
         # Verify delete_chunk was called for similar fragments
         self.mock_rag.delete_chunk.assert_any_call("hash2")
 
+    async def test_make_updates_leaves_late_replies_queued(self):
+        """Test that replies queued while updates are in flight wait for the next pass"""
+        await self.region.inbox.put({"source": "other_region", "role": "reply", "content": "First update"})
+        mock_chunk = DocumentChunk(
+            chunk_hash="hash1",
+            content="Old fact",
+            metadata=ChunkMetadata(actors=["historian"], timestamp=int(time.time()))
+        )
+
+        async def retrieve(update, *args):
+            self.region._incoming_replies.append(("late_region", "Late update"))
+            return [RetrievalResult(chunk=mock_chunk, similarity_score=0.9)]
+
+        self.mock_rag.retrieve_similar.side_effect = retrieve
+
+        result = await self.region.make_updates()
+
+        self.assertTrue(result)
+        self.assertEqual(self.mock_rag.retrieve_similar.await_count, 1)
+        self.assertEqual(self.region._incoming_replies.popleft(), ("late_region", "Late update"))
+
+    async def test_make_updates_failure_does_not_reuse_previous_results(self):
+        """Test that a failed retrieval is not processed with the previous update's results"""
+        mock_chunk = DocumentChunk(
+            chunk_hash="hash1",
+            content="Old fact",
+            metadata=ChunkMetadata(actors=["historian"], timestamp=int(time.time()))
+        )
+        self.mock_rag.retrieve_similar.side_effect = [
+            [RetrievalResult(chunk=mock_chunk, similarity_score=0.9)],
+            Exception("Retrieval error")
+        ]
+        await self.region.inbox.put({"source": "region_a", "role": "reply", "content": "First update"})
+        await self.region.inbox.put({"source": "region_b", "role": "reply", "content": "Second update"})
+
+        result = await self.region.make_updates()
+
+        self.assertFalse(result)
+        self.mock_rag.update_chunk.assert_awaited_once()
+
     async def test_make_updates_no_results(self):
         """Test handling when no retrieval results are found"""
         # Setup incoming knowledge update
@@ -280,7 +391,7 @@ class TestRAGRegion(unittest.TestCase):
         result = await self.region.make_updates()
 
         self.assertFalse(result)
-        self.assertTrue(self.region._incoming_replies.empty())
+        self.assertFalse(self.region._incoming_replies)
 
     async def test_make_updates_failure(self):
         """Test handling of RAG failures during update processing"""
@@ -299,7 +410,7 @@ class TestRAGRegion(unittest.TestCase):
         result = await self.region.make_updates()
 
         self.assertFalse(result)
-        self.assertTrue(self.region._incoming_replies.empty())
+        self.assertFalse(self.region._incoming_replies)
 
     async def test_make_updates_consolidation_threshold(self):
         """Test consolidation behavior with different thresholds"""
@@ -414,9 +525,24 @@ class TestRAGRegion(unittest.TestCase):
     def test_make_replies_without_actors_sync(self):
         self.run_async_test(self.test_make_replies_without_actors)
 
+    def test_make_replies_escapes_content_sync(self):
+        self.run_async_test(self.test_make_replies_escapes_content)
+
+    def test_make_replies_posts_in_completion_order_sync(self):
+        self.run_async_test(self.test_make_replies_posts_in_completion_order)
+
+    def test_make_replies_deduplicates_questions_sync(self):
+        self.run_async_test(self.test_make_replies_deduplicates_questions)
+
     def test_make_updates_success_sync(self):
         self.run_async_test(self.test_make_updates_success)
 
+    def test_make_updates_leaves_late_replies_queued_sync(self):
+        self.run_async_test(self.test_make_updates_leaves_late_replies_queued)
+
+    def test_make_updates_failure_does_not_reuse_previous_results_sync(self):
+        self.run_async_test(self.test_make_updates_failure_does_not_reuse_previous_results)
+
     def test_make_updates_no_results_sync(self):
         self.run_async_test(self.test_make_updates_no_results)
 
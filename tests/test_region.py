@@ -1,8 +1,11 @@
 import asyncio
 import json
 import unittest
+from collections import deque
 from unittest.mock import MagicMock, AsyncMock, patch  # Import AsyncMock
 
+import aiohttp
+
 from llmlink import LLMLink
 from regions.region import Region
 from utils import make_prompt
@@ -14,6 +17,8 @@ class TestRegion(unittest.TestCase):
         # Mock LLMLink dependency with proper async mock
         self.mock_llm = MagicMock()
         self.mock_llm.text = AsyncMock()  # CRITICAL FIX: Use AsyncMock for async methods
+        # Reject batches as unsupported, so prompts go through text() unless a test mocks batching
+        self.mock_llm.text_batch = AsyncMock(side_effect=ValueError("batch unsupported"))
 
         # Create test region with real connections
         self.region = Region(
@@ -43,8 +48,8 @@ class TestRegion(unittest.TestCase):
         self.assertEqual(self.region.connections, {"other_region": "other task"})
         self.assertIsInstance(self.region.inbox, asyncio.Queue)
         self.assertIsInstance(self.region.outbox, asyncio.Queue)
-        self.assertIsInstance(self.region._incoming_replies, asyncio.Queue)
-        self.assertIsInstance(self.region._incoming_requests, asyncio.Queue)
+        self.assertIsInstance(self.region._incoming_replies, deque)
+        self.assertIsInstance(self.region._incoming_requests, deque)
 
     async def test_post(self):
         """Test _post correctly formats and queues messages"""
@@ -86,8 +91,8 @@ class TestRegion(unittest.TestCase):
 
         self.region._run_inbox()
 
-        self.assertEqual([*self.region._incoming_replies.__dict__['_queue']], [{"other_region": "knowledge"}])
-        self.assertEqual([*self.region._incoming_requests.__dict__['_queue']], [{"other_region": "question"}])
+        self.assertEqual([*self.region._incoming_replies], [("other_region", "knowledge")])
+        self.assertEqual([*self.region._incoming_requests], [("other_region", "question")])
 
     async def test_make_prompt(self):
         """Test prompt construction with default delimiters"""
@@ -122,7 +127,7 @@ class TestRegion(unittest.TestCase):
                 print("\n=== CAPLOG ===\n" + '\n'.join(cm.output) + "\n=== END CAPLOG ===")
 
         self.assertTrue(result)
-        self.assertTrue(self.region._incoming_requests.empty())
+        self.assertFalse(self.region._incoming_requests)
 
         # Verify reply was sent
         message = await self.region.outbox.get()
@@ -147,7 +152,189 @@ class TestRegion(unittest.TestCase):
         result = await self.test_region.make_replies()
 
         self.assertFalse(result)
-        self.assertTrue(self.region._incoming_requests.empty())  # Queries still cleared
+        self.assertFalse(self.region._incoming_requests)  # Queries still cleared
+
+    async def test_make_replies_multiple_requests(self):
+        """Test that every pending request receives its own reply"""
+        for source in ("region_a", "region_b", "region_c"):
+            await self.test_region.inbox.put({
+                "source": source,
+                "role": "request",
+                "content": f"Question from {source}"
+            })
+        self.test_region._run_inbox()
+
+        self.mock_llm.text.return_value = "Answer"
+
+        result = await self.test_region.make_replies()
+
+        self.assertTrue(result)
+        self.assertEqual(self.mock_llm.text.await_count, 3)
+        self.assertFalse(self.test_region._incoming_requests)
+        destinations = []
+        while not self.test_region.outbox.empty():
+            message = self.test_region.outbox.get_nowait()
+            self.assertEqual(message["content"], "Answer")
+            destinations.append(message["destination"])
+        self.assertEqual(destinations, ["region_a", "region_b", "region_c"])
+
+    async def test_make_replies_shared_prefix(self):
+        """Test that prompts in one batch differ only in the user question"""
+        for source in ("region_a", "region_b"):
+            await self.test_region.inbox.put({
+                "source": source,
+                "role": "request",
+                "content": f"Question from {source}"
+            })
+        self.mock_llm.text.return_value = "Answer"
+
+        await self.test_region.make_replies()
+
+        prompts = [call.args[0] for call in self.mock_llm.text.await_args_list]
+        prefixes = [prompt.split("user\n")[0] for prompt in prompts]
+        self.assertEqual(len(prompts), 2)
+        self.assertEqual(prefixes[0], prefixes[1])
+        self.assertIn("Question from region_a", prefixes[0])
+        self.assertIn("Question from region_b", prefixes[0])
+
+    async def test_make_replies_batched(self):
+        """Test that several pending requests are sent to the LLM in one batch"""
+        self.mock_llm.text_batch = AsyncMock(return_value=["Answer A", "<think>hmm</think>\nAnswer B"])
+        for source in ("region_a", "region_b"):
+            await self.test_region.inbox.put({
+                "source": source,
+                "role": "request",
+                "content": f"Question from {source}"
+            })
+
+        result = await self.test_region.make_replies()
+
+        self.assertTrue(result)
+        self.mock_llm.text_batch.assert_awaited_once()
+        self.assertEqual(len(self.mock_llm.text_batch.await_args.args[0]), 2)
+        self.mock_llm.text.assert_not_awaited()
+        first = self.test_region.outbox.get_nowait()
+        second = self.test_region.outbox.get_nowait()
+        self.assertEqual((first["destination"], first["content"]), ("region_a", "Answer A"))
+        self.assertEqual((second["destination"], second["content"]), ("region_b", "Answer B"))
+
+    async def test_make_replies_batch_fallback(self):
+        """Test that an unsupported batch falls back to one LLM call per request"""
+        self.mock_llm.text_batch = AsyncMock(side_effect=ValueError("batch unsupported"))
+        self.mock_llm.text.return_value = "Answer"
+        for source in ("region_a", "region_b"):
+            await self.test_region.inbox.put({
+                "source": source,
+                "role": "request",
+                "content": f"Question from {source}"
+            })
+
+        result = await self.test_region.make_replies()
+
+        self.assertTrue(result)
+        self.assertEqual(self.mock_llm.text.await_count, 2)
+        self.assertEqual(self.test_region.outbox.qsize(), 2)
+
+    async def test_make_replies_batch_timeout_falls_back(self):
+        """Test that a timed-out batch is retried as one LLM call per request"""
+        self.mock_llm.text_batch = AsyncMock(side_effect=asyncio.TimeoutError())
+        self.mock_llm.text.return_value = "Answer"
+        for source in ("region_a", "region_b"):
+            await self.test_region.inbox.put({
+                "source": source,
+                "role": "request",
+                "content": f"Question from {source}"
+            })
+
+        result = await self.test_region.make_replies()
+
+        self.assertTrue(result)
+        self.mock_llm.text_batch.assert_awaited_once()
+        self.assertEqual(self.mock_llm.text.await_count, 2)
+        self.assertEqual(self.test_region.outbox.qsize(), 2)
+
+    async def test_make_replies_batch_fallback_partial_failure(self):
+        """Test that after a failed batch only the prompts whose own call fails go unanswered"""
+        self.mock_llm.text_batch = AsyncMock(side_effect=aiohttp.ClientConnectionError("reset"))
+        # The individual call for region_a succeeds, the one for region_b times out
+        self.mock_llm.text.side_effect = ["Answer", asyncio.TimeoutError()]
+        for source in ("region_a", "region_b"):
+            await self.test_region.inbox.put({
+                "source": source,
+                "role": "request",
+                "content": f"Question from {source}"
+            })
+
+        result = await self.test_region.make_replies()
+
+        self.assertFalse(result)
+        self.assertEqual(self.mock_llm.text.await_count, 2)
+        self.assertEqual(self.test_region.outbox.get_nowait()["destination"], "region_a")
+        self.assertTrue(self.test_region.outbox.empty())
+
+    async def test_make_replies_deduplicates_prompts(self):
+        """Test that identical requests from different sources share one LLM call"""
+        self.mock_llm.text.return_value = "Summary"
+        for source in ("region_a", "region_b"):
+            await self.test_region.inbox.put({
+                "source": source,
+                "role": "request",
+                "content": "Summarize the knowledge you have."
+            })
+
+        result = await self.test_region.make_replies()
+
+        self.assertTrue(result)
+        self.assertEqual(self.mock_llm.text.await_count, 1)
+        self.assertEqual(self.test_region.outbox.qsize(), 2)
+
+    async def test_replies_block_deduplicates_content(self):
+        """Test that repeated knowledge from several sources appears once in the prompt"""
+        self.test_region._incoming_replies.append(("region_a", "Shared fact"))
+        self.test_region._incoming_replies.append(("region_b", "Shared fact"))
+        self.test_region._incoming_replies.append(("region_c", "Other fact"))
+
+        block = self.test_region._replies_block()
+
+        self.assertEqual(block.count("Shared fact"), 1)
+        self.assertIn("region_a", block)
+        self.assertNotIn("region_b", block)
+        self.assertIn("Other fact", block)
+        self.assertEqual(len(self.test_region._incoming_replies), 3)
+
+    async def test_make_replies_respects_max_inflight(self):
+        """Test that concurrent LLM calls never exceed the region's semaphore limit"""
+        self.test_region = Region(
+            name="test_region",
+            task="test task",
+            llm=self.mock_llm,
+            connections={"other_region": "other task"},
+            max_inflight=2
+        )
+        in_flight = 0
+        peak = 0
+
+        async def slow_text(prompt):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "Answer"
+
+        self.mock_llm.text.side_effect = slow_text
+        for source in ("region_a", "region_b", "region_c", "region_d"):
+            await self.test_region.inbox.put({
+                "source": source,
+                "role": "request",
+                "content": f"Question from {source}"
+            })
+
+        result = await self.test_region.make_replies()
+
+        self.assertTrue(result)
+        self.assertEqual(self.mock_llm.text.await_count, 4)
+        self.assertEqual(peak, 2)
 
     async def test_make_questions_success(self):
         """Test successful question generation for connected regions"""
@@ -289,9 +476,9 @@ class TestRegion(unittest.TestCase):
         print("\n=== CAPLOG ===\n" + '\n'.join(cm.output) + "\n=== END CAPLOG ===")
 
         self.assertTrue(result)
-        self.assertEqual(self.test_region._incoming_replies.qsize(), 1)
-        summarized = await self.test_region._incoming_replies.get()
-        self.assertEqual(summarized["forecast_region"], "The current weather is sunny with rain expected tomorrow")
+        self.assertEqual(len(self.test_region._incoming_replies), 1)
+        summarized = self.test_region._incoming_replies.popleft()
+        self.assertEqual(summarized, ("forecast_region", "The current weather is sunny with rain expected tomorrow"))
 
     async def test_summarize_replies_failure(self):
         """Test summarize_replies handles LLM failures during summarization"""
@@ -313,13 +500,13 @@ class TestRegion(unittest.TestCase):
 
         self.assertFalse(result)
         # Original content should be restored
-        self.assertEqual(self.test_region._incoming_replies.qsize(), 1)
+        self.assertEqual(len(self.test_region._incoming_replies), 1)
 
     async def test_summarize_replies_empty_queue(self):
         """Test summarize_replies returns True immediately with empty queue"""
         result = await self.region.summarize_replies()
         self.assertTrue(result)
-        self.assertTrue(self.region._incoming_replies.empty())
+        self.assertFalse(self.region._incoming_replies)
 
 
     async def test_summarize_replies_single_reply(self):
@@ -339,7 +526,7 @@ class TestRegion(unittest.TestCase):
         print("\n=== CAPLOG ===\n" + '\n'.join(cm.output) + "\n=== END CAPLOG ===")
 
         self.assertTrue(result)
-        self.assertEqual(self.test_region._incoming_replies.qsize(), 1)
+        self.assertEqual(len(self.test_region._incoming_replies), 1)
 
     def test_initialization_sync(self):
         self.run_async_test(self.test_initialization)
@@ -365,6 +552,33 @@ class TestRegion(unittest.TestCase):
     def test_make_replies_failure_sync(self):
         self.run_async_test(self.test_make_replies_failure)
 
+    def test_make_replies_multiple_requests_sync(self):
+        self.run_async_test(self.test_make_replies_multiple_requests)
+
+    def test_make_replies_shared_prefix_sync(self):
+        self.run_async_test(self.test_make_replies_shared_prefix)
+
+    def test_make_replies_batched_sync(self):
+        self.run_async_test(self.test_make_replies_batched)
+
+    def test_make_replies_batch_fallback_sync(self):
+        self.run_async_test(self.test_make_replies_batch_fallback)
+
+    def test_make_replies_batch_timeout_falls_back_sync(self):
+        self.run_async_test(self.test_make_replies_batch_timeout_falls_back)
+
+    def test_make_replies_batch_fallback_partial_failure_sync(self):
+        self.run_async_test(self.test_make_replies_batch_fallback_partial_failure)
+
+    def test_make_replies_deduplicates_prompts_sync(self):
+        self.run_async_test(self.test_make_replies_deduplicates_prompts)
+
+    def test_replies_block_deduplicates_content_sync(self):
+        self.run_async_test(self.test_replies_block_deduplicates_content)
+
+    def test_make_replies_respects_max_inflight_sync(self):
+        self.run_async_test(self.test_make_replies_respects_max_inflight)
+
     def test_make_questions_success_sync(self):
         self.run_async_test(self.test_make_questions_success)
 
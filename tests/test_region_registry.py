@@ -1,11 +1,13 @@
+import asyncio
 import json
 import unittest
 import tempfile
 import os
 from unittest.mock import MagicMock, patch
 
-from region_registry import RegionRegistry, RegionEntry
+from region_registry import RegionRegistry, RegionEntry, _type_needs
 from mock_regions import MockRegion, MockRAGRegion
+from regions.broadcast_region import BroadcastRegion
 
 
 class TestRegionRegistry(unittest.TestCase):
@@ -39,6 +41,18 @@ class TestRegionRegistry(unittest.TestCase):
         self.assertEqual(self.registry.regions, [])
         self.assertEqual(self.registry.names, [])
 
+    async def test_default_dependencies_are_lazy(self):
+        """Test that default RAG and LLM are created per registry on first use"""
+        with patch("region_registry.DynamicRAGSystem") as rag_cls, patch("region_registry.LLMLink") as llm_cls:
+            rag_cls.side_effect = lambda: MagicMock()
+            first, second = RegionRegistry(), RegionRegistry()
+            rag_cls.assert_not_called()
+            llm_cls.assert_not_called()
+
+            self.assertIsNot(first.default_rag, second.default_rag)
+            self.assertIs(first.default_rag, first.default_rag)
+            self.assertEqual(rag_cls.call_count, 2)
+
     async def test_register_region(self):
         """Test region registration workflow"""
         entry = RegionEntry(
@@ -68,6 +82,16 @@ class TestRegionRegistry(unittest.TestCase):
         self.assertEqual(len(self.registry), 0)
         self.assertEqual(self.registry.names, [])
 
+    async def test_deregister_renamed_region(self):
+        """Test that an entry renamed in place can be removed by its new name"""
+        entry = RegionEntry(name="sales", type="MockRegion", task="handle sales inquiries")
+        self.registry.register(entry)
+        entry.name = "revenue"
+
+        self.assertTrue(self.registry.deregister("revenue"))
+        self.assertEqual(len(self.registry), 0)
+        self.assertFalse(self.registry.deregister("revenue"))
+
     async def test_load_json(self):
         """Test loading regions from JSON file"""
         # Create temporary JSON file
@@ -114,6 +138,21 @@ class TestRegionRegistry(unittest.TestCase):
         # Cleanup
         os.unlink(tmp_path)
 
+    async def test_load_list_duplicate_names(self):
+        """Test that duplicate names are rejected and reported"""
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as tmp:
+            json.dump([
+                {"name": "sales", "type": "MockRegion", "task": "a"},
+                {"name": "sales", "type": "MockRegion", "task": "b"}
+            ], tmp)
+            tmp_path = tmp.name
+
+        with self.assertRaises(ValueError) as context:
+            RegionEntry.load_list(tmp_path)
+        self.assertIn("'sales'", str(context.exception))
+
+        os.unlink(tmp_path)
+
     async def test_verify_valid(self):
         """Test verification of valid registry configuration"""
         # Setup valid registry
@@ -152,6 +191,42 @@ class TestRegionRegistry(unittest.TestCase):
         self.assertEqual(len(issues), 1)
         self.assertIn("Connection to 'invalid_region'", issues[0])
 
+    async def test_verify_listener_connections(self):
+        """Test that outgoing connections from a ListenerRegion are reported by name"""
+        self.registry.register(RegionEntry(name="sales", type="MockRegion", task="handle sales inquiries"))
+        self.registry.register(RegionEntry(name="ears", type="ListenerRegion", connections={"sales": "Sales"}))
+
+        with self.assertLogs(level="ERROR") as logs:
+            issues, warnings = self.registry.verify()
+        self.assertEqual(issues, 1)
+        self.assertTrue(any("'sales' specified for ListenerRegion 'ears'" in line for line in logs.output))
+
+    async def test_type_needs_reads_annotations(self):
+        """Test that default dependencies are detected from constructor annotations"""
+        self.assertEqual(_type_needs("Region")[:2], (False, True))
+        self.assertEqual(_type_needs("RAGRegion")[:2], (True, False))
+        self.assertEqual(_type_needs("MockRAGRegion")[:2], (False, False))
+
+    async def test_verify_unknown_type(self):
+        """Test that an undefined region type is reported as an issue"""
+        self.registry.register(RegionEntry(name="sales", type="NoSuchRegion", task="handle sales inquiries"))
+
+        issues, warnings = self.registry.verify()
+        self.assertEqual(issues, 1)
+        self.assertFalse(self.registry.build_regions())
+
+    async def test_verify_renamed_entry(self):
+        """Test that an entry renamed without re-keying is reported"""
+        entry = RegionEntry(name="sales", type="MockRegion", task="handle sales inquiries")
+        self.registry.register(entry)
+        entry.name = "revenue"
+
+        issues, warnings = self.registry.verify()
+        self.assertEqual(issues, 1)
+        self.registry._update_names()
+        issues, warnings = self.registry.verify()
+        self.assertEqual(issues, 0)
+
     async def test_build_regions_success(self):
         """Test successful region building"""
         # Setup registry with mock region
@@ -172,6 +247,52 @@ class TestRegionRegistry(unittest.TestCase):
         self.assertIsNotNone(self.registry["sales"])
         self.assertEqual(self.registry["sales"].name, "sales")
 
+    async def test_build_regions_always_verifies(self):
+        """Test that every build re-runs verification, even if the registry is unchanged"""
+        self.registry.register(RegionEntry(name="sales", type="MockRegion", task="handle sales inquiries"))
+        self.registry.verify()
+
+        with patch.object(self.registry, "verify", wraps=self.registry.verify) as verify:
+            self.assertTrue(self.registry.build_regions())
+            self.assertTrue(self.registry.build_regions(overwrite=True))
+            self.assertEqual(verify.call_count, 2)
+
+    async def test_build_regions_after_fixing_entry_in_place(self):
+        """Test that fixing an entry in place after a failed verify lets the build go ahead"""
+        entry = RegionEntry(name="sales", type="MockRegion", task="handle sales inquiries", connections={"ghost": "missing"})
+        self.registry.register(entry)
+        self.assertEqual(self.registry.verify()[0], 1)
+
+        entry.connections = {}
+        self.assertTrue(self.registry.build_regions())
+
+    async def test_build_regions_after_breaking_entry_in_place(self):
+        """Test that breaking an entry in place after a passing verify stops the build"""
+        self.registry.register(RegionEntry(name="sales", type="MockRegion", task="handle sales inquiries"))
+        self.assertEqual(self.registry.verify()[0], 0)
+
+        self.registry.regions[0].task = None
+        self.assertFalse(self.registry.build_regions())
+
+    async def test_make_region_passes_accepted_fields(self):
+        """Test that make_region only passes fields the region constructor accepts"""
+        entry = RegionEntry(name="ears", type="MockListenerRegion", task="listen", connections={"sales": "Sales"})
+        self.assertIsNotNone(entry.make_region())
+        self.assertEqual(entry.region.name, "ears")
+
+    async def test_make_region_passes_max_inflight(self):
+        """Test that an entry's max_inflight reaches the region's concurrency limit"""
+        entry = RegionEntry(name="sales", type="Region", task="handle sales inquiries", llm=self.mock_llm, max_inflight=3)
+        region = entry.make_region()
+        self.assertEqual(region.max_inflight, 3)
+        self.assertEqual(RegionEntry.make(region).max_inflight, 3)
+
+    async def test_make_region_passes_falsy_fields(self):
+        """Test that explicit zero or False field values reach the constructor"""
+        entry = RegionEntry(name="facts", type="MockRAGRegion", task="recall facts", threshold=0.0, reply_with_actors=False)
+        region = entry.make_region()
+        self.assertEqual(region.kwargs, {"threshold": 0.0, "reply_with_actors": False})
+
     async def test_build_regions_with_defaults(self):
         """Test region building with default dependencies"""
         # Setup registry with RAGRegion needing defaults
@@ -216,5 +337,105 @@ class TestRegionRegistry(unittest.TestCase):
 
         self.assertEqual(self.registry["sales"].task, "handle updated sales inquiries")
 
+    async def test_entry_rejects_unknown_attributes(self):
+        """Test that misspelled entry fields fail loudly"""
+        entry = RegionEntry(name="sales", type="MockRegion")
+        with self.assertRaises(AttributeError):
+            entry.tsak = "handle sales inquiries"
+
+    async def test_update_keeps_order(self):
+        """Test that updating an entry replaces it in place"""
+        for name in ("sales", "support"):
+            self.registry.register(RegionEntry(name=name, type="MockRegion", task="task"))
+
+        updated_entry = RegionEntry(name="sales", type="MockRegion", task="updated task")
+        self.assertTrue(self.registry.update(updated_entry))
+
+        self.assertEqual(self.registry.names, ["sales", "support"])
+        self.assertIs(self.registry.regions[0], updated_entry)
+
+    async def test_setitem_sets_or_replaces(self):
+        """Test that item assignment registers a live region under the key"""
+        self.registry["sales"] = BroadcastRegion("first")
+        self.registry["support"] = BroadcastRegion("second")
+        replacement = BroadcastRegion("third")
+        self.registry["sales"] = replacement
+
+        self.assertEqual(self.registry.names, ["sales", "support"])
+        self.assertIs(self.registry["sales"], replacement)
+        self.assertEqual(replacement.name, "sales")
+
+    async def test_rename_and_reindex(self):
+        """Test that renamed entries are re-keyed by _update_names"""
+        entry = RegionEntry(name="sales", type="MockRegion", task="handle sales inquiries")
+        self.registry.register(entry)
+
+        entry.name = "revenue"
+        self.registry._update_names()
+
+        self.assertEqual(self.registry.names, ["revenue"])
+        self.assertIs(self.registry.regions[0], entry)
+        with self.assertRaises(ValueError):
+            _ = self.registry["sales"]
+
+    def run_async_test(self, test_coroutine):
+        """Helper to run async tests"""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(self.asyncSetUp())
+        loop.run_until_complete(test_coroutine())
+        loop.close()
+
+    def test_default_dependencies_are_lazy_sync(self):
+        self.run_async_test(self.test_default_dependencies_are_lazy)
+
+    def test_deregister_renamed_region_sync(self):
+        self.run_async_test(self.test_deregister_renamed_region)
+
+    def test_load_list_duplicate_names_sync(self):
+        self.run_async_test(self.test_load_list_duplicate_names)
+
+    def test_verify_listener_connections_sync(self):
+        self.run_async_test(self.test_verify_listener_connections)
+
+    def test_type_needs_reads_annotations_sync(self):
+        self.run_async_test(self.test_type_needs_reads_annotations)
+
+    def test_verify_unknown_type_sync(self):
+        self.run_async_test(self.test_verify_unknown_type)
+
+    def test_verify_renamed_entry_sync(self):
+        self.run_async_test(self.test_verify_renamed_entry)
+
+    def test_build_regions_always_verifies_sync(self):
+        self.run_async_test(self.test_build_regions_always_verifies)
+
+    def test_build_regions_after_fixing_entry_in_place_sync(self):
+        self.run_async_test(self.test_build_regions_after_fixing_entry_in_place)
+
+    def test_build_regions_after_breaking_entry_in_place_sync(self):
+        self.run_async_test(self.test_build_regions_after_breaking_entry_in_place)
+
+    def test_make_region_passes_accepted_fields_sync(self):
+        self.run_async_test(self.test_make_region_passes_accepted_fields)
+
+    def test_make_region_passes_max_inflight_sync(self):
+        self.run_async_test(self.test_make_region_passes_max_inflight)
+
+    def test_make_region_passes_falsy_fields_sync(self):
+        self.run_async_test(self.test_make_region_passes_falsy_fields)
+
+    def test_entry_rejects_unknown_attributes_sync(self):
+        self.run_async_test(self.test_entry_rejects_unknown_attributes)
+
+    def test_update_keeps_order_sync(self):
+        self.run_async_test(self.test_update_keeps_order)
+
+    def test_setitem_sets_or_replaces_sync(self):
+        self.run_async_test(self.test_setitem_sets_or_replaces)
+
+    def test_rename_and_reindex_sync(self):
+        self.run_async_test(self.test_rename_and_reindex)
+
 if __name__ == '__main__':
     unittest.main()